@@ -0,0 +1,72 @@
+import os
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.engine.moves import MoveTask
+from src.gestures import Move
+from src.inference_client import InferenceClientManager
+from src.inference_stub import StubInferenceServer
+from src.utils import load_inference_sdk
+
+
+# Asks the stub for a move the way LlmOpponent asks the real endpoint, without writing the decision log
+class StubSide:
+    def __init__(self, name: str, manager: InferenceClientManager, url: str):
+        self.name = name
+        self.manager = manager
+        self.url = url
+
+    def choose(self) -> Move:
+        _, SystemMessage, _ = load_inference_sdk()
+        response = self.manager.complete("stub-key", endpoint=self.url, messages=[SystemMessage(content="Play a move.")], model="gpt-4o")
+        arguments = json.loads(response["choices"][0]["message"]["tool_calls"][0]["function"]["arguments"])
+        return Move.parse(arguments["Choice"])
+
+
+def sequential_round(sides, executor) -> float:
+    start = time.perf_counter()
+    for side in sides:
+        task = MoveTask(executor, side)
+        while task.poll() is None:
+            time.sleep(0.001)
+    return time.perf_counter() - start
+
+
+def concurrent_round(sides, executor) -> float:
+    start = time.perf_counter()
+    tasks = [MoveTask(executor, side) for side in sides]
+    while tasks:
+        tasks = [task for task in tasks if task.poll() is None]
+        time.sleep(0.001)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Round latency of AI vs AI with the two move requests one after the other or at once.")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.3, help="Seconds the stub takes per request.")
+    args = parser.parse_args()
+
+    manager = InferenceClientManager()
+    with StubInferenceServer(latency=args.latency) as stub, ThreadPoolExecutor(max_workers=4) as executor:
+        sides = [StubSide("AI 1", manager, stub.url), StubSide("AI 2", manager, stub.url)]
+        # Open the connections first so both runs only measure requests
+        concurrent_round(sides, executor)
+
+        print(f"{args.rounds} rounds, {args.latency * 1000:.0f} ms per request")
+        for name, play in (("one after the other", sequential_round), ("concurrent", concurrent_round)):
+            times = [play(sides, executor) for _ in range(args.rounds)]
+            print(f"{name:<20} {sum(times) / len(times) * 1000:8.1f} ms/round")
+    manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Render off screen so the benchmark runs anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.engine.assets import GameAssets, SpriteCache, SPRITES, BACKGROUND_SIZE
+
+
+# What every front-end used to do at import time: decode every full size PNG, then scale and round it
+def uncached(cache: SpriteCache):
+    for spec in SPRITES.values():
+        cache._build(cache._find_source(spec), spec)
+
+
+def load_all(cache_dir: str) -> SpriteCache:
+    assets = GameAssets(SpriteCache(cache_dir=cache_dir))
+    assets.preload()
+    return assets.cache
+
+
+# What the start screen needs before the first frame, the hand sprites are only loaded once a round ends
+def first_frame(cache_dir: str):
+    assets = GameAssets(SpriteCache(cache_dir=cache_dir))
+    for name in ("background", "user_profile", "computer_profile", "win_icon", "loss_icon", "draw_icon"):
+        getattr(assets, name)
+
+
+def measure(name: str, run, repeats: int):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    print(f"{name:<28} best {min(times) * 1000:8.1f} ms   mean {sum(times) / len(times) * 1000:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure sprite loading at startup with and without the sprite cache.")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode(BACKGROUND_SIZE)
+
+    cache_dir = tempfile.mkdtemp(prefix="rps-sprites-")
+    try:
+        plain = SpriteCache(cache_dir=cache_dir)
+        measure("decode and scale (before)", lambda: uncached(plain), args.repeats)
+        measure("cold cache", lambda: (shutil.rmtree(cache_dir, ignore_errors=True), load_all(cache_dir)), args.repeats)
+        measure("warm cache, all sprites", lambda: load_all(cache_dir), args.repeats)
+        measure("warm cache, first frame", lambda: first_frame(cache_dir), args.repeats)
+        cache = load_all(cache_dir)
+        print(f"Warm run: {cache.hits} cache hits, {cache.misses} misses")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
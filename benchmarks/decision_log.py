@@ -0,0 +1,69 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.decision_log import DecisionLog, read_decisions
+
+ENTRY = {"Choice": "Rock", "Reason": "The user played paper twice in a row, so scissors is likely next and rock beats it.", "Name": "AI 1"}
+
+
+# What every move used to do: read the whole log, append, write it all back
+def read_modify_write(log_file_path: str):
+    if os.path.exists(log_file_path):
+        with open(log_file_path, "r") as log_file:
+            logs = json.load(log_file)
+    else:
+        logs = []
+    logs.append(ENTRY)
+    with open(log_file_path, "w") as log_file:
+        json.dump(logs, log_file, indent=4)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cost of logging one decision as the log grows, old JSON array against JSON Lines.")
+    parser.add_argument("--history", type=int, nargs="+", default=[100, 1000, 10000], help="Decisions already in the log.")
+    parser.add_argument("--moves", type=int, default=50, help="Decisions logged per measurement.")
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp(prefix="rps-decisions-")
+    try:
+        for history in args.history:
+            json_path = os.path.join(folder, f"log-{history}.json")
+            with open(json_path, "w") as file:
+                json.dump([ENTRY] * history, file, indent=4)
+            start = time.perf_counter()
+            for _ in range(args.moves):
+                read_modify_write(json_path)
+            old_time = (time.perf_counter() - start) / args.moves
+
+            jsonl_path = os.path.join(folder, f"log-{history}.jsonl")
+            with DecisionLog(jsonl_path, max_bytes=None) as log:
+                for _ in range(history):
+                    log.append(ENTRY)
+            # Flush every entry to compare the worst case, the game batches them
+            with DecisionLog(jsonl_path, flush_every=1, max_bytes=None) as log:
+                start = time.perf_counter()
+                for _ in range(args.moves):
+                    log.append(ENTRY)
+                new_time = (time.perf_counter() - start) / args.moves
+
+            start = time.perf_counter()
+            count = sum(1 for _ in read_decisions(jsonl_path))
+            read_time = time.perf_counter() - start
+            print(f"history {history:>7}: read-modify-write {old_time * 1000:8.3f} ms/move   append {new_time * 1000:7.3f} ms/move   "
+                  f"streaming {count} decisions {read_time * 1000:7.1f} ms")
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+import cv2
+import numpy as np
+import pygame
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.frame_adapter import FrameAdapter
+
+
+# The conversion chain detect_user_choice used to run on every camera frame
+def old_chain(surface):
+    view = pygame.surfarray.array3d(surface)
+    view = view.transpose([1, 0, 2])
+    return cv2.cvtColor(view, cv2.COLOR_RGB2BGR)
+
+
+def measure(name: str, convert, frames: int):
+    convert()  # first call may allocate the reused buffers
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(frames):
+        convert()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<22} {elapsed / frames * 1000:8.3f} ms/frame   peak allocated {peak / 1024:9.1f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the old surface to OpenCV conversion chain with the frame adapter.")
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    args = parser.parse_args()
+
+    # A camera style 24 bit surface filled with noise, no window is needed
+    surface = pygame.Surface((args.width, args.height), depth=24)
+    pygame.surfarray.blit_array(surface, np.random.randint(0, 255, (args.width, args.height, 3), dtype=np.uint8))
+    bgr = np.random.randint(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+
+    adapter = FrameAdapter(args.width, args.height)
+    slot = np.empty((args.height, args.width, 3), dtype=np.uint8)
+
+    print(f"{args.frames} frames of {args.width}x{args.height}")
+    measure("array3d+transpose+cvt", lambda: old_chain(surface), args.frames)
+    measure("adapter surface", lambda: adapter.from_surface(surface, out=slot), args.frames)
+    measure("adapter bgr", lambda: adapter.from_bgr(bgr, out=slot), args.frames)
+
+    adapter.stats.reset()
+    adapter.from_surface(surface, out=slot)
+    adapter.from_bgr(bgr)
+    copies, allocations = adapter.stats.per_frame()
+    print(f"Adapter: {copies:.1f} copies and {allocations:.1f} allocations per frame (the old chain makes 2 copies and 2 allocations)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.gesture_classifiers import get_classifier
+from src.gesture_classifiers import NUM_CLASSES
+from src.gesture_model import DEFAULT_LOG_PATH, RECORD_LOG_HINT, LearnedGestureClassifier, load_training_data, split_data
+
+
+# Median time of a single hand prediction and batch throughput
+def time_classifier(classifier, hands: np.ndarray, repeats: int = 200):
+    single = []
+    for index in range(repeats):
+        hand = hands[index % len(hands)][np.newaxis]
+        start = time.perf_counter()
+        classifier.predict(hand)
+        single.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    classifier.predict(hands)
+    batch = time.perf_counter() - start
+    return float(np.median(single)) * 1e6, len(hands) / batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Accuracy and latency of the learned gesture classifier against the rules.")
+    parser.add_argument("--log", nargs="+", default=[DEFAULT_LOG_PATH], help="Detection logs with labelled hands.")
+    parser.add_argument("--labels", help="CSV of round,gesture corrections, only with a single --log.")
+    parser.add_argument("--model", help="Weights to evaluate, trains a fresh model on the training split when omitted.")
+    parser.add_argument("--hidden", type=int, default=16)
+    parser.add_argument("--hands", type=int, default=1000, help="Random hands to time on when there is no detection log.")
+    args = parser.parse_args()
+    if args.labels and len(args.log) > 1:
+        parser.error("--labels corrects a single detection log, pass only one --log with it.")
+
+    missing = [path for path in args.log if not os.path.exists(path)]
+    if missing:
+        # Without a log there is nothing to score against, the latency is the same on any hands and weights
+        print(f"No detection log at {', '.join(missing)}, {RECORD_LOG_HINT} to measure accuracy.")
+        print("Timing inference on random hands instead.")
+        rng = np.random.default_rng(0)
+        val_x, val_y = rng.random((args.hands, 21, 3), dtype=np.float32), None
+        train_x, train_y = val_x, rng.integers(0, NUM_CLASSES, len(val_x))
+    else:
+        landmarks, labels = load_training_data(args.log, args.labels)
+        train_x, train_y, val_x, val_y = split_data(landmarks, labels)
+        if len(val_y) == 0:
+            print("Not enough labelled hands for a validation split.")
+            return
+
+    if args.model:
+        learned = LearnedGestureClassifier(args.model)
+    else:
+        learned = LearnedGestureClassifier()
+        learned.fit(train_x, train_y, hidden=args.hidden)
+
+    classifiers = {
+        "rules": get_classifier("rules"),
+        "features": get_classifier("features"),
+        "learned": learned,
+    }
+
+    print(f"Validation hands: {len(val_x)}")
+    print(f"{'classifier':<10} {'accuracy':>9} {'single hand':>12} {'batch':>16}")
+    for name, classifier in classifiers.items():
+        accuracy = f"{np.mean(classifier.predict(val_x) == val_y):9.3f}" if val_y is not None else f"{'-':>9}"
+        single_us, per_second = time_classifier(classifier, val_x)
+        print(f"{name:<10} {accuracy} {single_us:9.1f} us {per_second:12,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
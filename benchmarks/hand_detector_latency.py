@@ -0,0 +1,72 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+import cv2
+import numpy as np
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.hand_detector import HandDetector, mp_hands
+
+
+# Load a test frame as RGB, falling back to random noise
+def load_frame(path: str, width: int, height: int) -> np.ndarray:
+    if path and os.path.exists(path):
+        frame = cv2.imread(path)
+        frame = cv2.resize(frame, (width, height))
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
+
+
+# Old behaviour: build, run and close a new graph every round
+def cold_round(frame: np.ndarray) -> float:
+    start = time.perf_counter()
+    hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
+    hands.process(frame)
+    hands.close()
+    return time.perf_counter() - start
+
+
+# New behaviour: reuse one warmed up detector
+def warm_round(detector: HandDetector, frame: np.ndarray) -> float:
+    start = time.perf_counter()
+    detector.process(frame)
+    return time.perf_counter() - start
+
+
+def summarize(name: str, samples):
+    samples_ms = sorted(sample * 1000 for sample in samples)
+    p95 = samples_ms[min(len(samples_ms) - 1, int(len(samples_ms) * 0.95))]
+    print(f"{name:<6} mean {statistics.mean(samples_ms):8.2f} ms   median {statistics.median(samples_ms):8.2f} ms   p95 {p95:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cold (per-round) and warm (shared) hand detection latency.")
+    parser.add_argument("--rounds", type=int, default=20, help="Number of rounds to time for each mode.")
+    parser.add_argument("--image", default=os.path.join(root_dir, "data/assets/Screenshot1.png"), help="Frame to run detection on.")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    args = parser.parse_args()
+
+    frame = load_frame(args.image, args.width, args.height)
+
+    cold = [cold_round(frame) for _ in range(args.rounds)]
+
+    detector = HandDetector()
+    warm_up_time = detector.warm_up(args.width, args.height)
+    warm = [warm_round(detector, frame) for _ in range(args.rounds)]
+    detector.close()
+
+    print(f"Rounds: {args.rounds}, frame: {args.width}x{args.height}, warm-up: {warm_up_time * 1000:.2f} ms")
+    summarize("cold", cold)
+    summarize("warm", warm)
+    print(f"Speed-up: {statistics.mean(cold) / statistics.mean(warm):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import os
+import sys
+import time
+import argparse
+from types import SimpleNamespace
+
+# Render off screen so the benchmark runs anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.engine.assets import PROFILE_SIZE, ICON_SIZE, CHOICE_SIZE
+from src.engine.render import Renderer, WIDTH, HEIGHT, WHITE, BLACK, GRAY, LIGHT_GRAY, SHADOW_COLOR
+from src.gestures import Move, MOVES
+
+
+# Plain colored sprites with the game's sizes, the timings do not depend on the pictures
+def make_assets():
+    def sprite(size, color, alpha=True):
+        surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+        surface.fill(color)
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    return SimpleNamespace(
+        background=sprite((WIDTH, HEIGHT), (30, 60, 90), alpha=False),
+        user_profile=sprite((PROFILE_SIZE, PROFILE_SIZE), (200, 50, 50)),
+        computer_profile=sprite((PROFILE_SIZE, PROFILE_SIZE), (50, 200, 50)),
+        win_icon=sprite((ICON_SIZE, ICON_SIZE), (0, 255, 0)),
+        loss_icon=sprite((ICON_SIZE, ICON_SIZE), (255, 0, 0)),
+        draw_icon=sprite((ICON_SIZE, ICON_SIZE), (0, 0, 255)),
+        choices=[sprite((CHOICE_SIZE, CHOICE_SIZE), (120, 120, 120)) for _ in MOVES],
+    )
+
+
+# What every frame used to do: redraw everything and render all text again
+def old_frame(screen, assets, font, small_font, state):
+    screen.blit(assets.background, (0, 0))
+    pygame.draw.rect(screen, LIGHT_GRAY, (0, 0, WIDTH, 80))
+    pygame.draw.rect(screen, SHADOW_COLOR, (0, 80, WIDTH, 10))
+    screen.blit(assets.user_profile, (20, 5))
+    screen.blit(assets.computer_profile, (WIDTH - PROFILE_SIZE - 20, 5))
+    for scores, x in ((state["left"], 120), (state["right"], WIDTH - 360)):
+        for key, icon, offset in (("wins", assets.win_icon, 0), ("losses", assets.loss_icon, 80), ("draws", assets.draw_icon, 160)):
+            screen.blit(icon, (x + offset, 25))
+            screen.blit(small_font.render(f"x{scores[key]}", True, BLACK), (x + offset + 30, 25))
+    if state["left_choice"] is not None:
+        screen.blit(assets.choices[state["left_choice"]], (WIDTH // 4 - CHOICE_SIZE // 2, 200))
+    if state["right_choice"] is not None:
+        screen.blit(assets.choices[state["right_choice"]], (3 * WIDTH // 4 - CHOICE_SIZE // 2, 200))
+    result_surface = font.render(state["result"], True, WHITE)
+    screen.blit(result_surface, ((WIDTH - result_surface.get_width()) // 2, HEIGHT - 100))
+    prompt_surface = small_font.render(state["prompt"], True, GRAY)
+    screen.blit(prompt_surface, ((WIDTH - prompt_surface.get_width()) // 2, HEIGHT - 50))
+    pygame.display.update()
+    return WIDTH * HEIGHT
+
+
+def new_frame(renderer, state):
+    renderer.draw_scores(state["left"], state["right"])
+    renderer.draw_choices(state["left_choice"], state["right_choice"])
+    renderer.draw_result(state["result"])
+    renderer.draw_prompt(state["prompt"])
+    return sum(rect.width * rect.height for rect in renderer.present())
+
+
+# A round finishes every round_frames frames, everything else is the idle screen between rounds
+def states(frames: int, round_frames: int):
+    left = {"wins": 0, "losses": 0, "draws": 0}
+    right = {"wins": 0, "losses": 0, "draws": 0}
+    state = {"left": left, "right": right, "left_choice": None, "right_choice": None, "result": "", "prompt": "Press Tab to Play"}
+    for frame in range(frames):
+        if frame and frame % round_frames == 0:
+            left["wins"] += 1
+            right["losses"] += 1
+            state.update(left_choice=Move.ROCK, right_choice=Move.SCISSORS, result="You Win!", prompt="Press Tab to Play Again")
+        yield state
+
+
+def measure(name: str, draw, frames: int, round_frames: int):
+    pixels = 0
+    start_cpu, start = time.process_time(), time.perf_counter()
+    for state in states(frames, round_frames):
+        pixels += draw(state)
+    cpu, elapsed = time.process_time() - start_cpu, time.perf_counter() - start
+    print(f"{name:<18} {elapsed / frames * 1000:7.3f} ms/frame   cpu {cpu / frames * 1000:7.3f} ms/frame   {pixels / frames / 1000:8.1f} kpx pushed/frame")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full frame HUD redraws with the dirty rectangle renderer.")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--round-frames", type=int, default=150, help="Frames between score changes")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    assets = make_assets()
+    font = pygame.font.SysFont(None, 55)
+    small_font = pygame.font.SysFont(None, 35)
+    renderer = Renderer(screen, assets)
+
+    print(f"{args.frames} frames, a score change every {args.round_frames} frames")
+    measure("full redraw", lambda state: old_frame(screen, assets, font, small_font, state), args.frames, args.round_frames)
+    measure("dirty rectangles", lambda state: new_frame(renderer, state), args.frames, args.round_frames)
+    print(f"Text cache: {renderer.text_cache.hits} hits, {renderer.text_cache.misses} renders")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+import os
+import sys
+import time
+import argparse
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.inference_client import InferenceClientManager
+from src.inference_stub import StubInferenceServer
+from src.utils import load_inference_sdk
+
+
+def play(manager: InferenceClientManager, url: str):
+    _, SystemMessage, _ = load_inference_sdk()
+    manager.complete("stub-key", endpoint=url, messages=[SystemMessage(content="Play a move.")], model="gpt-4o")
+
+
+def measure(name: str, stub: StubInferenceServer, moves: int, shared: bool):
+    connections = stub.connections
+    manager = InferenceClientManager()
+    start = time.perf_counter()
+    for _ in range(moves):
+        if shared:
+            play(manager, stub.url)
+        else:
+            # What every move used to do: build a client, connect, ask, drop the client
+            fresh = InferenceClientManager()
+            play(fresh, stub.url)
+            fresh.close()
+            manager.setup_times += fresh.setup_times
+            manager.cold_request_times += fresh.cold_request_times
+    elapsed = time.perf_counter() - start
+    manager.close()
+
+    stats = manager.stats()
+    print(
+        f"{name:<18} {elapsed / moves * 1000:8.1f} ms/move   {stub.connections - connections:4} connections   "
+        f"setup {stats['setup_ms']:6.2f} ms   connecting request {stats['cold_request_ms']:7.2f} ms   "
+        f"request on open connection {stats['warm_request_ms']:7.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare a new inference client per move with the shared, pooled client.")
+    parser.add_argument("--moves", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.01, help="Seconds the stub takes per request.")
+    parser.add_argument("--connect-delay", type=float, default=0.05, help="Stub cost of a new connection, stands in for TLS.")
+    args = parser.parse_args()
+
+    with StubInferenceServer(latency=args.latency, connect_delay=args.connect_delay) as stub:
+        print(f"{args.moves} moves against {stub.url}")
+        measure("client per move", stub, args.moves, shared=False)
+        measure("shared client", stub, args.moves, shared=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.utils import classify_hand_landmarks
+from src.gestures import gesture_code
+from src.landmarks import classify_landmarks_array
+
+
+# Random hands in the unit square, enough to exercise every branch of the rules
+def random_hands(count: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.random((count, 21, 3), dtype=np.float32)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-hand list classification with the vectorized batch path.")
+    parser.add_argument("--hands", type=int, default=100000, help="Number of hands to classify.")
+    parser.add_argument("--log", help="Use the landmarks of a detection log instead of random hands.")
+    args = parser.parse_args()
+
+    if args.log:
+        from src.detection_log import read_detection_log
+        records = read_detection_log(args.log)
+        hands = np.ascontiguousarray(records["landmarks"][records["hand_found"] == 1])
+    else:
+        hands = random_hands(args.hands)
+
+    # Old path: list of tuples per hand
+    lists = [[tuple(point) for point in hand] for hand in hands.tolist()]
+    start = time.perf_counter()
+    list_codes = [gesture_code(classify_hand_landmarks(landmarks)) for landmarks in lists]
+    list_time = time.perf_counter() - start
+
+    # New path: one call over the whole batch
+    start = time.perf_counter()
+    array_codes = classify_landmarks_array(hands)
+    array_time = time.perf_counter() - start
+
+    mismatches = int(np.count_nonzero(np.asarray(list_codes) != array_codes))
+    print(f"Hands: {len(hands)}, mismatches between paths: {mismatches}")
+    print(f"list  {len(hands) / list_time:14,.0f} hands/s")
+    print(f"array {len(hands) / array_time:14,.0f} hands/s")
+
+
+if __name__ == "__main__":
+    main()
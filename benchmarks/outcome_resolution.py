@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+import argparse
+import numpy as np
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.gestures import MOVES
+from src.outcome import determine_outcome, resolve_many, aggregate, empty_scores, add_outcome, tournament
+
+
+# What the game used to do for every round: compare move names one by one
+def chained_comparisons(move: str, other_move: str) -> str:
+    if move == other_move:
+        return "draw"
+    if (move == "rock" and other_move == "scissors") or \
+       (move == "paper" and other_move == "rock") or \
+       (move == "scissors" and other_move == "paper"):
+        return "win"
+    return "loss"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-round winner logic with the vectorized payoff matrix.")
+    parser.add_argument("--rounds", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    moves = rng.integers(0, len(MOVES), args.rounds, dtype=np.int8)
+    other_moves = rng.integers(0, len(MOVES), args.rounds, dtype=np.int8)
+
+    # Old path: move names and chained comparisons
+    names = [MOVES[move].key for move in moves.tolist()]
+    other_names = [MOVES[move].key for move in other_moves.tolist()]
+    start = time.perf_counter()
+    old_scores, old_other_scores = empty_scores(), empty_scores()
+    for move, other_move in zip(names, other_names):
+        add_outcome(old_scores, old_other_scores, chained_comparisons(move, other_move))
+    old_time = time.perf_counter() - start
+
+    # Table lookup per round
+    typed = [MOVES[move] for move in moves.tolist()]
+    other_typed = [MOVES[move] for move in other_moves.tolist()]
+    start = time.perf_counter()
+    table_scores, table_other_scores = empty_scores(), empty_scores()
+    for move, other_move in zip(typed, other_typed):
+        add_outcome(table_scores, table_other_scores, determine_outcome(move, other_move))
+    table_time = time.perf_counter() - start
+
+    # New path: one call over every round
+    start = time.perf_counter()
+    scores, other_scores = aggregate(resolve_many(moves, other_moves))
+    array_time = time.perf_counter() - start
+
+    agree = old_scores == table_scores == scores and old_other_scores == table_other_scores == other_scores
+    print(f"Rounds: {args.rounds}, all paths agree: {agree}, scores: {scores}")
+    print(f"chained comparisons {args.rounds / old_time:16,.0f} rounds/s")
+    print(f"payoff table        {args.rounds / table_time:16,.0f} rounds/s")
+    print(f"vectorized          {args.rounds / array_time:16,.0f} rounds/s")
+
+    strategies = {
+        "uniform": (1 / 3, 1 / 3, 1 / 3),
+        "rock heavy": (0.5, 0.25, 0.25),
+        "paper heavy": (0.25, 0.5, 0.25),
+        "always scissors": (0.0, 0.0, 1.0),
+    }
+    start = time.perf_counter()
+    totals = tournament(strategies, args.rounds, seed=args.seed)
+    print(f"\nTournament, {args.rounds} rounds per pairing, {time.perf_counter() - start:.2f} s")
+    for name, total in sorted(totals.items(), key=lambda item: item[1]["wins"] - item[1]["losses"], reverse=True):
+        print(f"{name:<16} wins {total['wins']:>9}  losses {total['losses']:>9}  draws {total['draws']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import argparse
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.engine.history import RoundHistory, estimate_tokens
+from src.engine.opponents import LLM_PROMPT
+from src.gestures import MOVES
+from src.outcome import determine_outcome
+from src.utils import load_inference_sdk
+
+# How the history used to be written, one line per round for the whole session
+OLD_RESULTS = {"win": "AI Wins", "loss": "AI Loses", "draw": "Draw"}
+
+
+def request_time(manager, url: str, prompt: str, repeats: int = 5) -> float:
+    """Mean seconds for one move request carrying the prompt"""
+    _, SystemMessage, _ = load_inference_sdk()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        manager.complete("stub-key", endpoint=url, messages=[SystemMessage(content=prompt)], model="gpt-4o")
+    return (time.perf_counter() - start) / repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prompt size and build time as a session grows, unbounded history against RoundHistory.")
+    parser.add_argument("--rounds", type=int, nargs="+", default=[10, 100, 1000, 10000], help="Session lengths to report.")
+    parser.add_argument("--history-rounds", type=int, default=20)
+    parser.add_argument("--history-tokens", type=int, default=400)
+    parser.add_argument("--stub", action="store_true", help="Also time a request carrying each prompt against the local stub endpoint.")
+    args = parser.parse_args()
+
+    manager = stub = None
+    if args.stub:
+        from src.inference_client import InferenceClientManager
+        from src.inference_stub import StubInferenceServer
+        manager = InferenceClientManager()
+        stub = StubInferenceServer().start()
+        # Open the connection so every measured request reuses it
+        request_time(manager, stub.url, LLM_PROMPT, repeats=1)
+
+    # The same scripted session for both, the user cycles through the moves with some noise
+    old_history = ""
+    history = RoundHistory(recent_rounds=args.history_rounds, max_tokens=args.history_tokens)
+    played = 0
+    print(f"{'rounds':>7} {'old tokens':>11} {'old build ms':>13} {'new tokens':>11} {'new build ms':>13}" + ("   old request ms   new request ms" if stub else ""))
+    for target in sorted(args.rounds):
+        while played < target:
+            own_move, other_move = MOVES[(played * 7) % 3], MOVES[(played + played // 5) % 3]
+            old_history += f"AI: {own_move.key}, User: {other_move.key}, Result: {OLD_RESULTS[determine_outcome(own_move, other_move)]}\n"
+            history.add(own_move, other_move)
+            played += 1
+
+        start = time.perf_counter()
+        old_prompt = LLM_PROMPT.replace("{history_placeholder}", old_history)
+        old_build = time.perf_counter() - start
+        start = time.perf_counter()
+        new_prompt = LLM_PROMPT.replace("{history_placeholder}", history.render())
+        new_build = time.perf_counter() - start
+
+        line = (f"{played:>7} {estimate_tokens(old_prompt):>11} {old_build * 1000:>13.3f} "
+                f"{estimate_tokens(new_prompt):>11} {new_build * 1000:>13.3f}")
+        if stub:
+            line += f"   {request_time(manager, stub.url, old_prompt) * 1000:>14.1f}   {request_time(manager, stub.url, new_prompt) * 1000:>14.1f}"
+        print(line)
+
+    if stub:
+        stub.stop()
+        manager.close()
+    print("Tokens are estimated at four characters per token. A hosted model also spends prefill time on every prompt token.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+import time
+import threading
+import logging
+import numpy as np
+from typing import List, Optional, Tuple
+
+from src.frame_adapter import FrameAdapter
+
+
+# Fixed size ring buffer of RGB frames, allocated once up front
+class FrameRingBuffer:
+    def __init__(self, capacity: int, height: int, width: int, channels: int = 3):
+        """
+        Preallocate storage for the most recent frames.
+
+        :param capacity: Number of frames kept, must be at least 2.
+        :param height: Frame height in pixels.
+        :param width: Frame width in pixels.
+        :param channels: Channels per pixel.
+        """
+        if capacity < 2:
+            raise ValueError("FrameRingBuffer needs a capacity of at least 2.")
+        self.capacity = capacity
+        self.frames = np.zeros((capacity, height, width, channels), dtype=np.uint8)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.count = 0  # total number of frames ever committed
+        self.lock = threading.Lock()
+        self.new_frame = threading.Condition(self.lock)
+
+    def next_slot(self) -> np.ndarray:
+        """Return the slot the writer should fill next, it is never handed to readers until committed"""
+        return self.frames[self.count % self.capacity]
+
+    def commit(self, timestamp: float):
+        """Publish the slot returned by next_slot"""
+        with self.lock:
+            self.timestamps[self.count % self.capacity] = timestamp
+            self.count += 1
+            self.new_frame.notify_all()
+
+    def _indices(self, n: int) -> List[int]:
+        # Keep one slot free for the writer so a reader never copies a frame being overwritten
+        n = min(n, self.count, self.capacity - 1)
+        return [(self.count - n + i) % self.capacity for i in range(n)]
+
+    def latest_view(self) -> Tuple[Optional[np.ndarray], Optional[float], int]:
+        """
+        Return the newest frame without copying, with its timestamp and sequence number.
+        The view stays valid until capacity - 1 more frames were committed, check with is_current.
+        """
+        with self.lock:
+            if self.count == 0:
+                return None, None, 0
+            index = (self.count - 1) % self.capacity
+            view = self.frames[index]
+            view.flags.writeable = False
+            return view, float(self.timestamps[index]), self.count
+
+    def is_current(self, sequence: int) -> bool:
+        """True while the frame returned by latest_view with this sequence number has not been overwritten"""
+        return self.count - sequence < self.capacity - 1
+
+    def latest(self) -> Tuple[Optional[np.ndarray], Optional[float]]:
+        """Return a copy of the newest frame and its timestamp, or (None, None) if nothing was captured yet"""
+        with self.lock:
+            if self.count == 0:
+                return None, None
+            index = (self.count - 1) % self.capacity
+            return self.frames[index].copy(), float(self.timestamps[index])
+
+    def recent(self, n: int) -> List[Tuple[np.ndarray, float]]:
+        """Return copies of up to n newest frames, oldest first"""
+        with self.lock:
+            return [(self.frames[i].copy(), float(self.timestamps[i])) for i in self._indices(n)]
+
+    def around(self, timestamp: float, n: int) -> List[Tuple[np.ndarray, float]]:
+        """Return copies of the n frames closest in time to timestamp, oldest first"""
+        with self.lock:
+            indices = self._indices(self.capacity)
+            indices.sort(key=lambda i: abs(self.timestamps[i] - timestamp))
+            chosen = sorted(indices[:n], key=lambda i: self.timestamps[i])
+            return [(self.frames[i].copy(), float(self.timestamps[i])) for i in chosen]
+
+    def wait(self, after_count: int, timeout: float) -> bool:
+        """Block until more than after_count frames were committed"""
+        with self.lock:
+            return self.new_frame.wait_for(lambda: self.count > after_count, timeout)
+
+
+# Background thread that keeps pulling frames from a camera into a ring buffer
+class CameraCapture:
+    def __init__(self, source, width: int = 640, height: int = 480, capacity: int = 16):
+        """
+        Wrap a camera so frames are grabbed off the render loop.
+
+        :param source: A started pygame.camera.Camera, an opened cv2.VideoCapture or a cv2 device index.
+        :param width: Frame width in pixels.
+        :param height: Frame height in pixels.
+        :param capacity: Number of recent frames to keep.
+        """
+        if isinstance(source, int):
+            import cv2
+            source = cv2.VideoCapture(source)
+            source.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            source.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+        self.source = source
+        self.width = width
+        self.height = height
+        self.buffer = FrameRingBuffer(capacity, height, width)
+        self.adapter = FrameAdapter(width, height)
+        self.is_pygame = hasattr(source, "get_image")
+        self.running = False
+        self.thread = None
+        self.errors = 0
+
+        # Reusable buffers so steady state capture does not allocate. The camera surface keeps the camera's native
+        # size, get_image refuses a destination of any other size, frames are scaled into a separate surface
+        self._surface = None
+        self._scaled = None
+        self._bgr = None
+
+    def start(self):
+        """Start the capture thread"""
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name="camera-capture")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        """Stop the capture thread, the camera itself is left to its owner"""
+        self.running = False
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+            self.thread = None
+
+    def _read_pygame(self, slot: np.ndarray) -> bool:
+        import pygame
+        self._surface = self.source.get_image(self._surface) if self._surface is not None else self.source.get_image()
+        surface = self._surface
+        if surface.get_size() != (self.width, self.height):
+            if self._scaled is None:
+                self._scaled = pygame.Surface((self.width, self.height), 0, surface)
+            surface = pygame.transform.scale(surface, (self.width, self.height), self._scaled)
+        # One copy straight from the surface pixels into the ring slot
+        self.adapter.from_surface(surface, out=slot)
+        return True
+
+    def _read_cv2(self, slot: np.ndarray) -> bool:
+        import cv2
+        ok, frame = self.source.read(self._bgr)
+        if not ok:
+            return False
+        if frame.shape[:2] != (self.height, self.width):
+            frame = cv2.resize(frame, (self.width, self.height))
+        else:
+            self._bgr = frame
+        self.adapter.from_bgr(frame, out=slot)
+        return True
+
+    def _run(self):
+        read = self._read_pygame if self.is_pygame else self._read_cv2
+        while self.running:
+            try:
+                if read(self.buffer.next_slot()):
+                    self.buffer.commit(time.monotonic())
+                else:
+                    self.errors += 1
+                    time.sleep(0.01)
+            except Exception as e:
+                self.errors += 1
+                logging.error(f"Camera capture error: {str(e)}")
+                time.sleep(0.1)
+
+    def latest(self, timeout: float = 1.0) -> Tuple[Optional[np.ndarray], Optional[float]]:
+        """Return the newest RGB frame, waiting up to timeout for the first one to arrive"""
+        if self.buffer.count == 0:
+            self.buffer.wait(0, timeout)
+        return self.buffer.latest()
+
+    def recent(self, n: int) -> List[Tuple[np.ndarray, float]]:
+        """Return up to n newest RGB frames with their timestamps, oldest first"""
+        return self.buffer.recent(n)
+
+    def around(self, timestamp: float, n: int) -> List[Tuple[np.ndarray, float]]:
+        """Return the n frames closest to a time.monotonic() timestamp, e.g. the end of the countdown"""
+        return self.buffer.around(timestamp, n)
+
+    def copies_per_frame(self) -> Tuple[float, float]:
+        """Average (copies, allocations) spent converting each captured frame"""
+        return self.adapter.stats.per_frame()
+
+    @property
+    def fps(self) -> float:
+        """Capture rate measured over the frames currently in the buffer"""
+        with self.buffer.lock:
+            times = [self.buffer.timestamps[i] for i in self.buffer._indices(self.buffer.capacity)]
+        if len(times) < 2 or times[-1] == times[0]:
+            return 0.0
+        return (len(times) - 1) / (times[-1] - times[0])
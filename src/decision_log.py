@@ -0,0 +1,196 @@
+import os
+import sys
+import json
+import time
+import atexit
+import logging
+import argparse
+import threading
+from collections import Counter
+from typing import Dict, Iterator, List, Optional
+
+# One JSON object per line, appending a decision never touches the ones before it
+DEFAULT_LOG_PATH = "logs/decisions.jsonl"
+
+
+def _ends_with_newline(file_path: str) -> bool:
+    with open(file_path, "rb") as file:
+        file.seek(-1, os.SEEK_END)
+        return file.read(1) == b"\n"
+
+
+# Append only JSON Lines log of the language models' decisions, shared by every AI side.
+# Entries are buffered and written in batches, the file is rotated once it reaches max_bytes
+class DecisionLog:
+    def __init__(
+            self,
+            file_path: str = DEFAULT_LOG_PATH,
+            flush_every: int = 16,
+            flush_interval: float = 5.0,
+            max_bytes: Optional[int] = 10 * 1024 * 1024,
+            backups: int = 3
+        ):
+        """
+        :param file_path: Path of the log file.
+        :param flush_every: Write the buffer once it holds this many entries.
+        :param flush_interval: Write buffered entries at most this many seconds after the first of them was buffered,
+                               a timer flushes them even if no further entry arrives.
+        :param max_bytes: Rotate the file before it grows past this size, None for no limit.
+        :param backups: Rotated files kept as file_path.1 (newest) to file_path.<backups> (oldest).
+        """
+        self.file_path = file_path
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+
+        self.lock = threading.Lock()
+        self.buffer: List[str] = []
+        # Lines are pure ASCII, so the text length is the size on disk
+        self.file = open(file_path, "a", encoding="ascii")
+        self.size = self.file.tell()
+        if self.size and not _ends_with_newline(file_path):
+            # End a line torn by a crash so the next entry starts on its own line
+            self.file.write("\n")
+            self.size += 1
+        # Armed when the buffer stops being empty, writes it out once flush_interval has passed
+        self.timer: Optional[threading.Timer] = None
+        self.count = 0
+
+    def append(self, entry: Dict, stamp: bool = True):
+        """
+        Log one decision, safe to call from any thread.
+
+        :param entry: JSON serializable decision, e.g. {"Choice": "Rock", "Reason": "..."}.
+        :param stamp: Add the current time as Timestamp if the entry has none.
+        """
+        if stamp and "Timestamp" not in entry:
+            entry = {**entry, "Timestamp": time.time()}
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self.lock:
+            self.buffer.append(line)
+            self.count += 1
+            if len(self.buffer) >= self.flush_every:
+                self._flush()
+            elif self.timer is None and not self.file.closed:
+                self.timer = threading.Timer(self.flush_interval, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def _rotate(self):
+        self.file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.file_path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.file_path}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.file_path, f"{self.file_path}.1")
+        self.file = open(self.file_path, "w", encoding="ascii")
+        self.size = 0
+
+    def _flush(self):
+        """Write the buffer, the caller holds the lock"""
+        if self.timer is not None:
+            # A no-op when the timer itself is flushing
+            self.timer.cancel()
+            self.timer = None
+        if not self.buffer or self.file.closed:
+            return
+        data = "".join(self.buffer)
+        self.buffer.clear()
+        if self.max_bytes is not None and self.size and self.size + len(data) > self.max_bytes:
+            self._rotate()
+        self.file.write(data)
+        self.file.flush()
+        self.size += len(data)
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        with self.lock:
+            self._flush()
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_decisions(file_path: str = DEFAULT_LOG_PATH, rotated: bool = True) -> Iterator[Dict]:
+    """
+    Stream the logged decisions oldest first without loading the whole log.
+
+    :param file_path: Path of the log file.
+    :param rotated: Include the rotated files next to it.
+    :return: Iterator over the decisions, a torn line from a crash is skipped.
+    """
+    paths = []
+    if rotated:
+        index = 1
+        while os.path.exists(f"{file_path}.{index}"):
+            paths.insert(0, f"{file_path}.{index}")
+            index += 1
+    if os.path.exists(file_path):
+        paths.append(file_path)
+
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as file:
+            for number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"Skipping unreadable line {number} of {path}")
+
+
+_log: Optional[DecisionLog] = None
+_log_lock = threading.Lock()
+
+
+def get_decision_log() -> DecisionLog:
+    """The log shared by every AI side, flushed when the program exits"""
+    global _log
+    with _log_lock:
+        if _log is None:
+            _log = DecisionLog()
+            atexit.register(_log.close)
+        return _log
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize the language models' logged decisions.")
+    parser.add_argument("--log", default=DEFAULT_LOG_PATH)
+    parser.add_argument("--import-json", help="Append the entries of an old logs/log.json array to the log first.")
+    args = parser.parse_args()
+
+    if args.import_json:
+        with open(args.import_json, "r", encoding="utf-8") as file:
+            entries = json.load(file)
+        with DecisionLog(args.log) as log:
+            for entry in entries:
+                # The old log never recorded when a decision was made, do not pretend it was now
+                log.append({**entry, "Imported": True}, stamp=False)
+        print(f"Imported {len(entries)} decisions from {args.import_json}")
+
+    decisions = 0
+    choices: Dict[str, Counter] = {}
+    for entry in read_decisions(args.log):
+        decisions += 1
+        choices.setdefault(entry.get("Name", "AI"), Counter())[entry.get("Choice", "?")] += 1
+    if not decisions:
+        sys.exit(f"No decisions in {args.log}")
+
+    print(f"{decisions} decisions")
+    for name, counts in sorted(choices.items()):
+        total = sum(counts.values())
+        print(f"{name}: " + ", ".join(f"{choice} {count / total:.0%}" for choice, count in counts.most_common()))
+
+
+if __name__ == "__main__":
+    main()
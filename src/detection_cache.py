@@ -0,0 +1,92 @@
+import time
+import cv2
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+
+# Reuses the last hand detection while the camera sees practically the same picture
+class DetectionCache:
+    def __init__(self, size: Tuple[int, int] = (32, 24), mean_threshold: float = 2.0, cell_threshold: float = 12.0,
+                 max_reuse: int = 4, max_age: float = 0.25):
+        """
+        Frames are compared through a tiny grayscale thumbnail, far cheaper than running the hand graph.
+
+        :param size: (width, height) of the thumbnail, every cell averages a block of the frame.
+        :param mean_threshold: Largest average difference in gray levels (0-255) that still counts as the same scene.
+        :param cell_threshold: Largest difference of any single cell, so a moving hand in a still room is not missed.
+        :param max_reuse: Consecutive frames that may reuse a result before inference is forced again.
+        :param max_age: Seconds after which a stored result is never reused.
+        """
+        self.size = size
+        self.mean_threshold = mean_threshold
+        self.cell_threshold = cell_threshold
+        self.max_reuse = max_reuse
+        self.max_age = max_age
+
+        # Reused buffers, the cache does not allocate per frame
+        self._thumbnail = np.empty((size[1], size[0], 3), dtype=np.uint8)
+        self._current = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._stored = np.empty((size[1], size[0]), dtype=np.uint8)
+        self._diff = np.empty((size[1], size[0]), dtype=np.uint8)
+
+        self.result = None
+        self.stored_at = 0.0
+        self.reused = 0
+        self.hits = 0
+        self.misses = 0
+
+    def fingerprint(self, frame: np.ndarray) -> np.ndarray:
+        """Downsample an RGB frame to the grayscale thumbnail used for comparisons"""
+        cv2.resize(frame, self.size, dst=self._thumbnail, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._thumbnail, cv2.COLOR_RGB2GRAY, dst=self._current)
+        return self._current
+
+    def difference(self) -> Tuple[float, float]:
+        """(mean, largest cell) difference between the last fingerprinted frame and the stored one"""
+        cv2.absdiff(self._current, self._stored, dst=self._diff)
+        return float(self._diff.mean()), float(self._diff.max())
+
+    def lookup(self, frame: np.ndarray, now: Optional[float] = None):
+        """
+        Return the stored result if the frame matches the one it was computed on, otherwise None.
+        A miss leaves the frame's fingerprint ready for store.
+
+        :param frame: (height, width, 3) RGB frame.
+        :param now: time.monotonic() timestamp, taken when not given.
+        """
+        now = time.monotonic() if now is None else now
+        self.fingerprint(frame)
+
+        if self.result is not None and self.reused < self.max_reuse and now - self.stored_at <= self.max_age:
+            mean, largest = self.difference()
+            if mean <= self.mean_threshold and largest <= self.cell_threshold:
+                self.reused += 1
+                self.hits += 1
+                return self.result
+
+        self.misses += 1
+        return None
+
+    def store(self, result, now: Optional[float] = None):
+        """Remember the result computed for the frame passed to the last lookup"""
+        self._current, self._stored = self._stored, self._current
+        self.result = result
+        self.stored_at = time.monotonic() if now is None else now
+        self.reused = 0
+
+    def invalidate(self):
+        """Drop the stored result, e.g. after the detector settings changed"""
+        self.result = None
+        self.reused = 0
+
+    def reconfigure(self, **thresholds):
+        """Change mean_threshold, cell_threshold, max_reuse or max_age"""
+        for key, value in thresholds.items():
+            if key not in ("mean_threshold", "cell_threshold", "max_reuse", "max_age"):
+                raise ValueError(f"Unknown detection cache option: {key}")
+            setattr(self, key, value)
+
+    def stats(self) -> Dict[str, float]:
+        """Hit and miss counters since the cache was created"""
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0}
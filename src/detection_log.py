@@ -0,0 +1,134 @@
+import os
+import time
+import struct
+import threading
+import numpy as np
+from typing import Optional, Sequence
+
+from src.gestures import gesture_code, gesture_name
+
+# File layout: 16 byte header followed by fixed size records, so the file can be memory mapped as a record array
+MAGIC = b"RPSDLOG\x00"
+VERSION = 1
+HEADER = struct.Struct("<8sII")  # magic, version, record size
+
+NUM_LANDMARKS = 21
+
+DETECTION_DTYPE = np.dtype([
+    ("timestamp", "<f8"),  # unix time of the detection
+    ("round", "<u4"),  # record index in the file
+    ("gesture", "u1"),  # gesture code from src.gestures
+    ("hand_found", "u1"),  # 1 if the landmarks are valid
+    ("confidence", "<f4"),  # vote confidence from 0 to 1
+    ("latency_ms", "<f4"),  # time from the end of the countdown to the classified gesture
+    ("landmarks", "<f4", (NUM_LANDMARKS, 3)),  # normalized (x, y, z) Mediapipe landmarks
+])
+
+
+def _read_header(file_path: str) -> int:
+    """Validate the header and return the number of complete records in the file"""
+    size = os.path.getsize(file_path)
+    with open(file_path, "rb") as file:
+        magic, version, itemsize = HEADER.unpack(file.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"{file_path} is not a detection log.")
+    if version != VERSION or itemsize != DETECTION_DTYPE.itemsize:
+        raise ValueError(f"{file_path} uses detection log version {version}, expected {VERSION}.")
+    # A partially written trailing record from a crash is ignored
+    return (size - HEADER.size) // DETECTION_DTYPE.itemsize
+
+
+# Append only binary log of every detection round
+class DetectionLog:
+    def __init__(self, file_path: str = "logs/detections.rpsd"):
+        """
+        Open the log for appending, creating it with a header if it does not exist.
+
+        :param file_path: Path of the log file.
+        """
+        self.file_path = file_path
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+
+        if os.path.exists(file_path) and os.path.getsize(file_path) >= HEADER.size:
+            self.count = _read_header(file_path)
+            # Cut off a torn trailing record so new records stay aligned
+            os.truncate(file_path, HEADER.size + self.count * DETECTION_DTYPE.itemsize)
+            self.file = open(file_path, "ab")
+        else:
+            self.count = 0
+            self.file = open(file_path, "wb")
+            self.file.write(HEADER.pack(MAGIC, VERSION, DETECTION_DTYPE.itemsize))
+            self.file.flush()
+
+        self.record = np.zeros(1, dtype=DETECTION_DTYPE)
+        self.lock = threading.Lock()
+
+    def append(
+            self,
+            gesture: str,
+            confidence: float,
+            latency_ms: float,
+            landmarks: Optional[Sequence] = None,
+            timestamp: Optional[float] = None
+        ) -> int:
+        """
+        Append one detection.
+
+        :param gesture: Classified gesture name.
+        :param confidence: Confidence of the classification from 0 to 1.
+        :param latency_ms: Detection time in milliseconds.
+        :param landmarks: 21 (x, y, z) landmarks, or None if no hand was found.
+        :param timestamp: Unix time, defaults to now.
+        :return: The index of the new record.
+        """
+        with self.lock:
+            record = self.record
+            record["timestamp"] = time.time() if timestamp is None else timestamp
+            record["round"] = self.count
+            record["gesture"] = gesture_code(gesture)
+            record["confidence"] = confidence
+            record["latency_ms"] = latency_ms
+            if landmarks is not None:
+                record["landmarks"] = np.asarray(landmarks, dtype=np.float32).reshape(NUM_LANDMARKS, 3)
+                record["hand_found"] = 1
+            else:
+                record["landmarks"] = 0
+                record["hand_found"] = 0
+
+            self.file.write(self.record.tobytes())
+            self.file.flush()
+            self.count += 1
+            return self.count - 1
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_detection_log(file_path: str = "logs/detections.rpsd", mmap: bool = True) -> np.ndarray:
+    """
+    Load a detection log as a structured array with DETECTION_DTYPE fields.
+
+    :param file_path: Path of the log file.
+    :param mmap: Memory map the records instead of reading them into memory.
+    :return: One record per detection, e.g. log["landmarks"] has shape (N, 21, 3).
+    """
+    count = _read_header(file_path)
+    if count == 0:
+        return np.zeros(0, dtype=DETECTION_DTYPE)
+    if mmap:
+        return np.memmap(file_path, dtype=DETECTION_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+    with open(file_path, "rb") as file:
+        file.seek(HEADER.size)
+        return np.fromfile(file, dtype=DETECTION_DTYPE, count=count)
+
+
+def gesture_names(records: np.ndarray):
+    """Gesture names for an array of records"""
+    return [gesture_name(code) for code in records["gesture"]]
@@ -0,0 +1,18 @@
+# Shared game engine, main.py and the scripts in versions/ only pick the two sides.
+# Importing it is cheap, OpenCV, Mediapipe and the Azure SDK are only loaded by the sides that need them
+from src.engine.game import Game
+from src.outcome import determine_outcome
+from src.engine.detection import CameraPlayer
+from src.engine.opponents import Opponent, RandomOpponent, PatternOpponent, LlmOpponent, NetworkOpponent, OPPONENTS
+
+__all__ = [
+    "Game",
+    "determine_outcome",
+    "CameraPlayer",
+    "Opponent",
+    "RandomOpponent",
+    "PatternOpponent",
+    "LlmOpponent",
+    "NetworkOpponent",
+    "OPPONENTS",
+]
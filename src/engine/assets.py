@@ -0,0 +1,205 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+import pygame
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.gestures import Move, MOVES
+
+# Folder holding every image the game uses
+ASSET_DIR = "data/assets"
+
+# Preprocessed sprites, bump CACHE_VERSION whenever the way sprites are built changes
+CACHE_DIR = "data/cache/sprites"
+CACHE_VERSION = 1
+
+# Sprite sizes in pixels
+PROFILE_SIZE = 70
+ICON_SIZE = 30
+CHOICE_SIZE = 150
+
+# The window size, the cover is cropped to it just like blitting it at (0, 0) did
+BACKGROUND_SIZE = (800, 600)
+
+
+# How a sprite is built from its source image
+class SpriteSpec(NamedTuple):
+    files: Tuple[str, ...]  # candidate file names in ASSET_DIR, the first one that exists is used
+    size: Optional[Tuple[int, int]] = None  # scale to this size
+    crop: Optional[Tuple[int, int]] = None  # keep only the top left corner of this size
+    rounded: bool = False  # cut out a circle, for profile pictures
+    alpha: bool = True
+
+
+# Every sprite of the game
+SPRITES: Dict[str, SpriteSpec] = {
+    "background": SpriteSpec(("cover3.png",), crop=BACKGROUND_SIZE, alpha=False),
+    "user_profile": SpriteSpec(("user_profile.png", "profile.png"), size=(PROFILE_SIZE, PROFILE_SIZE), rounded=True),
+    "computer_profile": SpriteSpec(("computer_profile.png", "profile.png"), size=(PROFILE_SIZE, PROFILE_SIZE), rounded=True),
+    "win_icon": SpriteSpec(("win.png",), size=(ICON_SIZE, ICON_SIZE)),
+    "loss_icon": SpriteSpec(("loss.png",), size=(ICON_SIZE, ICON_SIZE)),
+    "draw_icon": SpriteSpec(("draw.png",), size=(ICON_SIZE, ICON_SIZE)),
+    "rock": SpriteSpec(("rock.png",), size=(CHOICE_SIZE, CHOICE_SIZE)),
+    "paper": SpriteSpec(("paper.png",), size=(CHOICE_SIZE, CHOICE_SIZE)),
+    "scissors": SpriteSpec(("scissors.png",), size=(CHOICE_SIZE, CHOICE_SIZE)),
+}
+
+
+# Making profile images round
+def make_round(image, size: Tuple[int, int]):
+    round_surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.ellipse(round_surface, (255, 255, 255), round_surface.get_rect(), 0)
+    round_surface.blit(image, (0, 0), special_flags=pygame.BLEND_RGBA_MIN)
+    return round_surface
+
+
+# Versioned on-disk cache of sprites that are already scaled, cropped and masked.
+# Entries are raw pixels keyed by the source file's hash and the target size, so loading one is a single read
+class SpriteCache:
+    def __init__(self, source_dir: str = ASSET_DIR, cache_dir: str = CACHE_DIR, version: int = CACHE_VERSION):
+        """
+        :param source_dir: Folder with the original images.
+        :param cache_dir: Folder for the preprocessed sprites, entries of other versions are removed.
+        :param version: Cache format version.
+        """
+        self.source_dir = source_dir
+        self.root = os.path.join(cache_dir, f"v{version}")
+        self.index_path = os.path.join(self.root, "index.json")
+        self.hits = 0
+        self.misses = 0
+        self.writable = True
+
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            for entry in os.listdir(cache_dir):
+                if entry != f"v{version}" and entry.startswith("v"):
+                    shutil.rmtree(os.path.join(cache_dir, entry), ignore_errors=True)
+        except OSError as e:
+            logging.warning(f"Sprite cache disabled: {str(e)}")
+            self.writable = False
+
+        # file name -> modification time, size and content hash, so unchanged sources are never hashed again
+        self.index: Dict[str, Dict] = {}
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, "r") as file:
+                    self.index = json.load(file)
+            except (OSError, ValueError):
+                self.index = {}
+
+    def _write(self, path: str, data: bytes):
+        """Write a file atomically so a crash never leaves a torn cache entry"""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def source_hash(self, path: str) -> str:
+        """Content hash of a source image, only recomputed when the file changed"""
+        stat = os.stat(path)
+        name = os.path.basename(path)
+        entry = self.index.get(name)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["sha1"]
+
+        with open(path, "rb") as file:
+            digest = hashlib.sha1(file.read()).hexdigest()
+        self.index[name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha1": digest}
+        if self.writable:
+            try:
+                self._write(self.index_path, json.dumps(self.index, indent=4).encode())
+            except OSError as e:
+                logging.warning(f"Could not update the sprite cache index: {str(e)}")
+        return digest
+
+    def _find_source(self, spec: SpriteSpec) -> str:
+        for file_name in spec.files:
+            path = os.path.join(self.source_dir, file_name)
+            if os.path.exists(path):
+                return path
+        raise FileNotFoundError(f"None of {', '.join(spec.files)} exist in {self.source_dir}.")
+
+    def _build(self, path: str, spec: SpriteSpec):
+        """Decode and preprocess a source image the slow way"""
+        image = pygame.image.load(path)
+        image = image.convert_alpha() if spec.alpha else image.convert()
+        if spec.crop is not None:
+            image = image.subsurface(pygame.Rect((0, 0), spec.crop).clip(image.get_rect())).copy()
+        if spec.size is not None:
+            image = pygame.transform.scale(image, spec.size)
+        if spec.rounded:
+            image = make_round(image, spec.size or image.get_size())
+        return image
+
+    def load(self, spec: SpriteSpec):
+        """
+        Return the sprite for a spec in the display format, from the cache when possible.
+        Needs an open display for convert().
+        """
+        path = self._find_source(spec)
+        target = spec.size or spec.crop
+        if target is None:
+            # Sprites kept at their native size are not worth caching
+            return self._build(path, spec)
+
+        pixel_format = "RGBA" if spec.alpha else "RGB"
+        variant = "round" if spec.rounded else "crop" if spec.crop else "scale"
+        stem = os.path.splitext(os.path.basename(path))[0]
+        cached_path = os.path.join(
+            self.root, f"{stem}-{self.source_hash(path)[:16]}-{target[0]}x{target[1]}-{variant}.{pixel_format.lower()}"
+        )
+
+        if os.path.exists(cached_path):
+            with open(cached_path, "rb") as file:
+                data = file.read()
+            try:
+                image = pygame.image.frombytes(data, target, pixel_format)
+                self.hits += 1
+                return image.convert_alpha() if spec.alpha else image.convert()
+            except ValueError:
+                logging.warning(f"Rebuilding corrupt sprite cache entry {cached_path}")
+
+        self.misses += 1
+        image = self._build(path, spec)
+        if self.writable and image.get_size() == target:
+            try:
+                self._write(cached_path, pygame.image.tobytes(image, pixel_format))
+            except OSError as e:
+                logging.warning(f"Could not write sprite cache entry: {str(e)}")
+        return image
+
+
+# Hand sprites in a table indexed by Move, each one is only loaded the first time it is shown
+class ChoiceSprites:
+    def __init__(self, assets: "GameAssets"):
+        self.assets = assets
+        self.table: List[Optional[pygame.Surface]] = [None] * len(MOVES)
+
+    def __getitem__(self, move: Move) -> pygame.Surface:
+        sprite = self.table[move]
+        if sprite is None:
+            sprite = self.table[move] = getattr(self.assets, MOVES[move].key)
+        return sprite
+
+
+# Every sprite of the game, loaded lazily through the sprite cache. Needs an open display for convert()
+class GameAssets:
+    def __init__(self, cache: Optional[SpriteCache] = None):
+        self.cache = cache if cache is not None else SpriteCache()
+        self.choices = ChoiceSprites(self)
+
+    def __getattr__(self, name: str):
+        # Only called for sprites that were not loaded yet
+        spec = SPRITES.get(name)
+        if spec is None:
+            raise AttributeError(name)
+        image = self.cache.load(spec)
+        setattr(self, name, image)
+        return image
+
+    def preload(self):
+        """Load every sprite now, e.g. while the player still looks at the start screen"""
+        for name in SPRITES:
+            getattr(self, name)
@@ -0,0 +1,139 @@
+import os
+import time
+import random
+
+from src.gestures import Move, MOVES, UNKNOWN, gesture_code
+
+# The person in front of the camera, plays whatever gesture the hand shows when the countdown ends.
+# OpenCV and Mediapipe are imported in prepare, which the game runs on a background thread while the title screen is up
+class CameraPlayer:
+    name = "You"
+    move_timeout = None
+    prefetch = False  # the move is the gesture at the end of the countdown
+
+    def __init__(self, camera_index: int = 0, width: int = 640, height: int = 480, vote_window: int = 8, log_folder: str = "logs"):
+        """
+        :param camera_index: pygame camera device index.
+        :param width: Camera frame width.
+        :param height: Camera frame height.
+        :param vote_window: Frames the gesture vote is taken over.
+        :param log_folder: Folder for the detection log and the sampled annotated images.
+        """
+        self.camera_index = camera_index
+        self.width = width
+        self.height = height
+        self.vote_window = vote_window
+        self.log_folder = log_folder
+        self.cam = None
+        self.capture = None
+        self.voter = None
+
+    def prepare(self):
+        """Open the camera and build the detection core once for the whole session"""
+        import pygame.camera
+        from src.camera_capture import CameraCapture
+        from src.detection_log import DetectionLog
+        from src.frame_logger import AsyncFrameLogger
+        from src.gesture_model import load_game_classifier
+        from src.gesture_voting import TemporalGestureVoter
+        from src.hand_detector import get_hand_detector
+
+        width, height = self.width, self.height
+        pygame.camera.init()
+        self.cam = pygame.camera.Camera(self.camera_index, (width, height))
+        self.cam.start()
+
+        # Keep pulling frames on a background thread so detection never waits on the driver
+        self.capture = CameraCapture(self.cam, width=width, height=height)
+        self.capture.start()
+
+        # Build the hand detector once and warm it up before the first round.
+        # It follows the hand with a region of interest, reuses its last result for frames that barely changed, and INFERENCE_WIDTH lets slow machines run inference on smaller frames
+        self.detector = get_hand_detector(
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.7,
+            track_roi=True,
+            cache_frames=True,
+            inference_width=int(os.getenv("INFERENCE_WIDTH", "0")) or None,
+        )
+
+        # Vote over the frames tracked during the countdown instead of trusting a single frame,
+        # classifying with the trained model in models/ if there is one, else the rotation and scale invariant feature rules
+        self.voter = TemporalGestureVoter(self.detector, window=self.vote_window, classify=load_game_classifier())
+
+        # Every round's landmarks go to a compact binary log, annotated images are only kept for every 10th round
+        self.detection_log = DetectionLog(os.path.join(self.log_folder, "detections.rpsd"))
+        self.frame_logger = AsyncFrameLogger(self.log_folder, image_format="jpg", max_files=200, sample_every=10)
+
+    def start_round(self):
+        """Start tracking the hand while the countdown runs"""
+        self.voter.watch(self.capture)
+
+    def cancel_round(self):
+        self.voter.finish()
+
+    def choose(self) -> Move:
+        """Capture and classify the player's choice"""
+        start = time.perf_counter()
+
+        # Stop tracking and take the confidence weighted vote over the frames seen during the countdown
+        vote = self.voter.finish()
+        if vote.frames == 0:
+            # Nothing was tracked during the countdown, vote over the newest buffered frames instead
+            vote = self.voter.classify_frames(self.capture.recent(self.vote_window))
+        gesture = vote.gesture
+
+        # Use the most confident frame of the winning gesture for the log
+        observation = self.voter.best_observation(gesture)
+        hand_landmarks = observation.hand_landmarks if observation is not None else None
+        landmarks = observation.landmarks if observation is not None else None
+
+        # Record landmarks, gesture, confidence and timing in the binary detection log
+        self.detection_log.append(gesture, vote.confidence, (time.perf_counter() - start) * 1000, landmarks)
+
+        # If gesture is unknown, generate a random result
+        code = gesture_code(gesture)
+        move = MOVES[code] if code != UNKNOWN else random.choice(MOVES)
+
+        # Annotated images are only kept for a sample of the rounds
+        if observation is not None and self.frame_logger.wants_frame():
+            import cv2
+            import mediapipe as mp
+            mp_hands = mp.solutions.hands
+            mp_drawing = mp.solutions.drawing_utils
+
+            # convert from rgb to bgr
+            img = cv2.cvtColor(observation.frame, cv2.COLOR_RGB2BGR)
+
+            # Annotate the image
+            if hand_landmarks is not None:
+                mp_drawing.draw_landmarks(img, hand_landmarks, mp_hands.HAND_CONNECTIONS,
+                                          mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2, circle_radius=4),
+                                          mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=2))
+
+            # Annotate the image with the result
+            cv2.putText(img, f"Gesture: {move.label} ({vote.confidence:.0%})", (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2, cv2.LINE_AA)
+
+            # Hand the annotated image to the logging worker, it is dropped rather than stalling the game if the worker is behind
+            self.frame_logger.submit(img)
+
+        return move
+
+    def record(self, own_move: Move, other_move: Move, outcome: str):
+        pass
+
+    def fallback_move(self) -> Move:
+        return random.choice(MOVES)
+
+    def close(self):
+        # prepare may have failed or never run
+        if self.voter is not None:
+            self.voter.finish()
+            self.frame_logger.close()
+            self.detection_log.close()
+            from src.hand_detector import close_hand_detector
+            close_hand_detector()
+        if self.capture is not None:
+            self.capture.stop()
+        if self.cam is not None:
+            self.cam.stop()
@@ -0,0 +1,269 @@
+import logging
+import pygame
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from typing import List, Optional
+
+from src.engine.assets import GameAssets
+from src.engine.moves import MoveTask
+from src.engine.opponents import Opponent
+from src.engine.render import Renderer, WIDTH, HEIGHT
+from src.gestures import Move
+from src.outcome import OPPOSITE, add_outcome, determine_outcome, empty_scores
+
+# Seconds counted down before the moves are taken
+COUNTDOWN = 3
+
+# Steps of a round, the game loop only ever checks where it is and never waits
+class Phase(Enum):
+    IDLE = "idle"  # no round played yet
+    COUNTDOWN = "countdown"
+    CAPTURE = "capture"  # the left player's move is being taken, a local opponent chooses at the same time
+    RESOLVE = "resolve"  # waiting for the opponent's move or the server's verdict
+    RESULT = "result"  # round over, showing the outcome
+
+
+# Text shown for the left player's outcome
+RESULT_TEXT = {"win": "You Win!", "loss": "You Lose!", "draw": "It's a Draw!"}
+
+
+# One game loop for every mode, the two sides decide where the moves come from
+class Game:
+    def __init__(self, player, opponent: Opponent, caption: str = "Rock Paper Scissors", fps: int = 30, profiler=None,
+                 prefetch: bool = True):
+        """
+        :param player: Left side, a CameraPlayer or any Opponent, e.g. an LlmOpponent for AI vs AI.
+        :param opponent: Right side. Remote opponents (NetworkOpponent) let the server run the rounds.
+        :param caption: Window title.
+        :param fps: Frame rate cap of the game loop.
+        :param profiler: StartupProfiler from src.startup_profile, the game quits with a report once it is interactive.
+        :param prefetch: Ask sides whose move does not depend on the current round, e.g. language models,
+                         for their move when the countdown starts instead of when it ends.
+        """
+        self.player = player
+        self.opponent = opponent
+        self.fps = fps
+        self.profiler = profiler
+        self.prefetch = prefetch
+
+        # Initialize Pygame
+        pygame.init()
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        pygame.display.set_caption(caption)
+        self.mark("window open")
+
+        # Detection and LLM calls run here, both sides at once, and the loop polls their futures every frame.
+        # The sides load their heavy dependencies here too, while the title screen is already up.
+        # Spare workers keep a new round from queueing behind a move that timed out but is still running
+        self.executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="round")
+        self.player_task: Optional[MoveTask] = None
+        self.opponent_task: Optional[MoveTask] = None
+        self.preparing: List[Future] = [self.executor.submit(self.prepare_side, side) for side in (player, opponent)]
+        self.load_error = ""
+
+        self.renderer = Renderer(self.screen, GameAssets(), divider=opponent.remote)
+        self.mark("static layer composed")
+
+        self.running = True
+        self.phase = Phase.IDLE
+        self.countdown = COUNTDOWN
+        self.last_countdown_update = 0
+        self.player_choice: Optional[Move] = None
+        self.opponent_choice: Optional[Move] = None
+        self.result_text = ""
+        self.player_scores = empty_scores()
+        self.opponent_scores = empty_scores()
+
+    def mark(self, label: str):
+        if self.profiler is not None:
+            self.profiler.mark(label)
+
+    def prepare_side(self, side):
+        side.prepare()
+        self.mark(f"{side.name} ready")
+
+    @property
+    def ready(self) -> bool:
+        """True once both sides finished loading"""
+        return not self.preparing
+
+    def check_loading(self):
+        """Poll the loading sides, a side that failed to load keeps the game on the title screen"""
+        for future in [future for future in self.preparing if future.done()]:
+            self.preparing.remove(future)
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Could not start the game: {str(e)}")
+                self.load_error = f"Could not start: {str(e)}"
+        if self.ready and not self.load_error:
+            self.mark("interactive")
+
+    def start_countdown(self, now: int):
+        """Start a round, the moves are taken when the countdown reaches zero"""
+        self.phase = Phase.COUNTDOWN
+        self.countdown = COUNTDOWN
+        self.last_countdown_update = now
+        self.player_choice = None
+        self.opponent_choice = None
+        self.result_text = ""
+
+        # Start tracking the hand while the countdown runs
+        self.player.start_round()
+        self.opponent.start_round()
+
+        # The countdown hides the latency of sides that can choose now, using the history as of the last finished round
+        if self.prefetch and not self.opponent.remote:
+            if getattr(self.player, "prefetch", False):
+                self.player_task = self.request_move(self.player)
+            if self.opponent.prefetch:
+                self.opponent_task = self.request_move(self.opponent)
+
+    def on_tab(self, now: int):
+        if not self.ready or self.load_error or self.phase not in (Phase.IDLE, Phase.RESULT):
+            return
+        if self.opponent.remote:
+            self.opponent.request_round()
+        else:
+            self.start_countdown(now)
+
+    def request_move(self, side) -> MoveTask:
+        """Take a side's move on a worker thread, within the side's move_timeout"""
+        return MoveTask(self.executor, side, getattr(side, "move_timeout", None))
+
+    def take_moves(self):
+        """The countdown is over, ask both sides that were not asked at its start for their moves at once"""
+        self.phase = Phase.CAPTURE
+        if self.player_task is None:
+            self.player_task = self.request_move(self.player)
+        if self.opponent_task is None and not self.opponent.remote:
+            self.opponent_task = self.request_move(self.opponent)
+
+    def poll_moves(self):
+        """Collect the moves that came in since the last frame"""
+        if self.player_task is not None:
+            move = self.player_task.poll()
+            if move is not None:
+                self.player_choice, self.player_task = move, None
+        if self.opponent_task is not None:
+            move = self.opponent_task.poll()
+            if move is not None:
+                self.opponent_choice, self.opponent_task = move, None
+
+    def score(self):
+        """Score a local round once both moves are in"""
+        outcome = determine_outcome(self.player_choice, self.opponent_choice)
+        self.result_text = RESULT_TEXT[outcome]
+        add_outcome(self.player_scores, self.opponent_scores, outcome)
+
+        self.player.record(self.player_choice, self.opponent_choice, outcome)
+        self.opponent.record(self.opponent_choice, self.player_choice, OPPOSITE[outcome])
+        self.phase = Phase.RESULT
+
+    def handle_server_events(self, now: int):
+        for event, payload in self.opponent.poll():
+            if event == "round_over" and self.phase == Phase.COUNTDOWN:
+                # The server called the round off before the moves were taken
+                self.player.cancel_round()
+                self.opponent.cancel_round()
+                self.phase = Phase.RESULT if self.result_text else Phase.IDLE
+            elif event == "countdown" and self.phase in (Phase.IDLE, Phase.RESULT):
+                self.start_countdown(now)
+            elif event == "result":
+                self.result_text, self.opponent_choice = payload
+                self.phase = Phase.RESULT
+        self.player_scores = self.opponent.player_scores
+        self.opponent_scores = self.opponent.opponent_scores
+
+    def update(self, now: int):
+        """Advance the round by at most one step, never blocking the frame"""
+        if not self.ready:
+            self.check_loading()
+            return
+
+        if self.opponent.remote:
+            self.handle_server_events(now)
+
+        if self.phase == Phase.COUNTDOWN:
+            # Update countdown every second without blocking
+            if now - self.last_countdown_update >= 1000:
+                self.last_countdown_update = now
+                self.countdown -= 1
+            if self.countdown == 0:
+                self.take_moves()
+
+        elif self.phase in (Phase.CAPTURE, Phase.RESOLVE) and not self.opponent.remote:
+            self.poll_moves()
+            if self.player_choice is None:
+                return
+            if self.opponent_choice is None:
+                self.phase = Phase.RESOLVE
+            else:
+                self.score()
+
+        elif self.phase == Phase.CAPTURE:
+            self.poll_moves()
+            if self.player_choice is not None:
+                # The server decides the round once both moves are in
+                self.opponent.submit(self.player_choice)
+                self.phase = Phase.RESOLVE
+
+    def prompt(self) -> Optional[str]:
+        if self.load_error:
+            return self.load_error
+        if not self.ready:
+            return "Loading..."
+        if self.phase == Phase.RESOLVE:
+            return "Waiting for results..." if self.opponent.remote else f"Waiting for {self.opponent.name}..."
+        if self.phase not in (Phase.IDLE, Phase.RESULT):
+            return None
+        if self.opponent.remote:
+            return "Press Tab to Play" if not self.opponent.player_ready else "Waiting for opponent..."
+        return "Press Tab to Play" if self.phase == Phase.IDLE else "Press Tab to Play Again"
+
+    def draw(self):
+        """Declare what the HUD shows this frame, the renderer works out what actually changed"""
+        renderer = self.renderer
+        if self.opponent.remote:
+            renderer.draw_labels(self.opponent.labels(), self.opponent.statuses())
+        renderer.draw_scores(self.player_scores, self.opponent_scores)
+        if self.phase == Phase.COUNTDOWN:
+            renderer.draw_countdown(self.countdown)
+        # A local opponent's move can come in first, it is only revealed with the result
+        renderer.draw_choices(self.player_choice, self.opponent_choice if self.phase == Phase.RESULT else None)
+        renderer.draw_result(self.result_text)
+        renderer.draw_prompt(self.prompt())
+
+    # Main game function
+    def run(self):
+        clock = pygame.time.Clock()
+        frames = 0
+        try:
+            while self.running:
+                now = pygame.time.get_ticks()
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    if event.type == pygame.KEYDOWN and event.key == pygame.K_TAB:
+                        self.on_tab(now)
+                    if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                        self.renderer.invalidate()
+
+                self.update(now)
+                self.draw()
+                self.renderer.present()
+
+                frames += 1
+                if self.profiler is not None:
+                    if frames == 1:
+                        self.mark("first frame")
+                    if self.ready:
+                        # Startup is over, print where the time went and quit
+                        print(self.profiler.report())
+                        self.running = False
+                clock.tick(self.fps)
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.player.close()
+            self.opponent.close()
+            pygame.quit()
@@ -0,0 +1,118 @@
+import math
+from collections import deque
+from typing import Callable, List, Optional
+
+from src.gestures import Move, MOVES
+from src.outcome import PAYOFF, WIN, LOSS, DRAW
+
+# How a round is written into an LLM player's history, from the LLM's point of view
+HISTORY_RESULTS = {WIN: "AI Wins", LOSS: "AI Loses", DRAW: "Draw"}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count, about four characters per token for English text"""
+    return math.ceil(len(text) / 4)
+
+
+# The rounds an LLM player has played, kept as one small int per round (AI move * 3 + user move) for the
+# most recent rounds plus running counts over the whole session. The prompt it renders has a bounded size
+# however long the session runs: totals, the user's move frequencies and transitions, then the last rounds
+class RoundHistory:
+    def __init__(self, recent_rounds: int = 20, max_tokens: Optional[int] = 400,
+                 count_tokens: Callable[[str], int] = estimate_tokens):
+        """
+        :param recent_rounds: Rounds listed one by one, older rounds only count towards the statistics.
+        :param max_tokens: Token budget of the rendered history, the oldest listed rounds are left out to stay within it
+                           and then the statistics are shortened.
+                           None for no budget.
+        :param count_tokens: Token counter, estimate_tokens by default. Pass the model's tokenizer for exact budgets.
+        """
+        self.recent = deque(maxlen=max(0, recent_rounds))
+        self.max_tokens = max_tokens
+        self.count_tokens = count_tokens
+
+        self.rounds = 0
+        self.results = {WIN: 0, LOSS: 0, DRAW: 0}
+        self.user_moves = [0] * len(MOVES)
+        # transitions[a][b] counts the user playing b right after a
+        self.transitions = [[0] * len(MOVES) for _ in MOVES]
+        self.last_user_move: Optional[Move] = None
+
+    def __len__(self) -> int:
+        return self.rounds
+
+    def add(self, own_move: Move, other_move: Move):
+        """Record a finished round, own_move is the AI's move and other_move the user's"""
+        self.recent.append(own_move * len(MOVES) + other_move)
+        self.rounds += 1
+        self.results[PAYOFF[own_move][other_move]] += 1
+        self.user_moves[other_move] += 1
+        if self.last_user_move is not None:
+            self.transitions[self.last_user_move][other_move] += 1
+        self.last_user_move = other_move
+
+    def round_lines(self) -> List[str]:
+        lines = []
+        for record in self.recent:
+            own_move, other_move = MOVES[record // len(MOVES)], MOVES[record % len(MOVES)]
+            lines.append(f"AI: {own_move.key}, User: {other_move.key}, Result: {HISTORY_RESULTS[PAYOFF[own_move][other_move]]}")
+        return lines
+
+    def summary_lines(self, transitions: bool = True) -> List[str]:
+        lines = [
+            f"Rounds played: {self.rounds}. AI wins: {self.results[WIN]}, AI losses: {self.results[LOSS]}, "
+            f"draws: {self.results[DRAW]}.",
+            "User move frequency: " + ", ".join(
+                f"{move.label} {count / self.rounds:.0%}" for move, count in zip(MOVES, self.user_moves)
+            ) + ".",
+        ]
+        if transitions and self.rounds > 1:
+            lines.append("User's next move after each move: " + "; ".join(
+                f"after {move.label}: " + ", ".join(f"{after.label} {count}" for after, count in zip(MOVES, row))
+                for move, row in zip(MOVES, self.transitions) if any(row)
+            ) + ".")
+        return lines
+
+    def truncate(self, text: str) -> str:
+        """The longest start of text that fits in max_tokens"""
+        if self.count_tokens(text) <= self.max_tokens:
+            return text
+        # Binary search on the length, token counts only grow with the text
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count_tokens(text[:middle]) <= self.max_tokens:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low]
+
+    def render(self) -> str:
+        """The history for the prompt, within max_tokens"""
+        if not self.rounds:
+            return "None"
+
+        rounds = self.round_lines()
+        summary = self.summary_lines()
+        if self.max_tokens is None:
+            return "\n".join(summary + ["Most recent rounds, oldest first:"] + rounds)
+
+        # Keep the newest rounds that fit next to the statistics, drop the transitions and then the move
+        # frequencies if even those do not fit
+        budget = self.max_tokens - self.count_tokens("\n".join(summary)) - self.count_tokens("Most recent rounds, oldest first:")
+        while budget < 0 and len(summary) > 1:
+            summary = summary[:-1]
+            budget = self.max_tokens - self.count_tokens("\n".join(summary)) - self.count_tokens("Most recent rounds, oldest first:")
+        if budget < 0:
+            # Not even the totals leave room for a round, cut them short if they do not fit on their own
+            return self.truncate("\n".join(summary))
+        kept = 0
+        for line in reversed(rounds):
+            cost = self.count_tokens(line) + 1  # the line break
+            if cost > budget:
+                break
+            budget -= cost
+            kept += 1
+        if not kept:
+            return "\n".join(summary)
+        return "\n".join(summary + ["Most recent rounds, oldest first:"] + rounds[len(rounds) - kept:])
@@ -0,0 +1,62 @@
+import time
+import random
+import logging
+import threading
+from concurrent.futures import Executor, Future
+from typing import Optional
+
+from src.gestures import Move, MOVES
+
+
+# A move being chosen on a worker thread. Both sides of a local round get one at the same time,
+# so two language models think in parallel, and the game loop polls them every frame.
+# A side that fails or runs out of time plays its fallback_move(), or a random move when it has none.
+# Its worker is then abandoned, a side with abandonable set leaves out the side effects of the late answer
+class MoveTask:
+    def __init__(self, executor: Executor, side, timeout: Optional[float] = None):
+        """
+        :param executor: Pool the side's choose() runs on.
+        :param side: Player or opponent.
+        :param timeout: Seconds the side gets before its fallback move is played, None waits forever.
+        """
+        self.side = side
+        self.timeout = timeout
+        self.started = time.perf_counter()
+        # Set once the game stopped waiting for this move
+        self.abandoned = threading.Event()
+        if getattr(side, "abandonable", False):
+            self.future: Future = executor.submit(side.choose, self.abandoned)
+        else:
+            self.future = executor.submit(side.choose)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def fallback(self) -> Move:
+        fallback_move = getattr(self.side, "fallback_move", None)
+        return fallback_move() if fallback_move is not None else random.choice(MOVES)
+
+    def poll(self) -> Optional[Move]:
+        """The move once it is in, None while it is still being chosen. A failed, late or invalid move is replaced by the fallback"""
+        if not self.future.done():
+            if self.timeout is None or self.elapsed < self.timeout:
+                return None
+            # A running worker finishes on its own, its answer is ignored and not logged as played
+            self.abandon()
+            logging.warning(f"{self.side.name} did not choose a move within {self.timeout:.1f} s, playing a fallback move")
+            return self.fallback()
+        try:
+            return Move.parse(self.future.result())
+        except Exception as e:
+            logging.error(f"{self.side.name} could not choose a move: {str(e)}")
+            return self.fallback()
+
+    def abandon(self):
+        """Stop waiting for the move"""
+        self.abandoned.set()
+        # Best effort, only a future that has not started yet can be cancelled
+        self.future.cancel()
+
+    def cancel(self):
+        self.abandon()
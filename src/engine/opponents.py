@@ -0,0 +1,267 @@
+import queue
+import random
+import threading
+import logging
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from src.engine.history import RoundHistory
+from src.gestures import Move, MOVES
+
+# Prompt for LLM players, {history_placeholder} is replaced with a summary of the game and the most recent rounds
+LLM_PROMPT = """
+    You are the best rock-paper-scissors player in the world, and you are in the finals against the user. Your goal is to win the game. Below is a summary of the game so far followed by the history of the most recent rounds. In each round, "AI" represents your choice, "User" represents the user's choice, and "Result" shows who won.
+
+    History:
+    {history_placeholder}
+
+    Analyze the user's past choices and any patterns you observe. Then, decide your next move: Rock, Paper, or Scissors. Your goal is to maximize your chances of winning. If no clear pattern is visible, make a logical guess to counter the user's most likely next move.
+
+    Respond in the following format:
+    Choice: [Your choice]
+    Reason: [Your reasoning for the choice]
+"""
+
+
+# A side of the board that picks its own move. The camera player implements the same methods
+class Opponent:
+    name = "Computer"
+    remote = False  # remote opponents let a server decide when rounds start and who won
+    move_timeout: Optional[float] = None  # seconds choose() gets before fallback_move() is played instead
+    prefetch = True  # choose() only depends on finished rounds, so the game asks for the move when the countdown starts
+    abandonable = False  # choose() takes a threading.Event that is set when the game stopped waiting for the move
+
+    def prepare(self):
+        """Load heavy dependencies, runs on a background thread once the window is open"""
+
+    def start_round(self):
+        """Called when the countdown starts"""
+
+    def cancel_round(self):
+        """Called when a started round is called off before the moves were taken"""
+
+    def choose(self) -> Move:
+        """Return the move once the countdown ended, runs on a worker thread"""
+        raise NotImplementedError
+
+    def record(self, own_move: Move, other_move: Move, outcome: str):
+        """Learn from a finished round, outcome is "win", "loss" or "draw" from this side's point of view"""
+
+    def fallback_move(self) -> Move:
+        """Played when choose() fails or misses move_timeout"""
+        return random.choice(MOVES)
+
+    def close(self):
+        pass
+
+
+# The classic computer opponent
+class RandomOpponent(Opponent):
+    def choose(self) -> Move:
+        return random.choice(MOVES)
+
+
+# Local AI that needs no network, counters the move the player most often follows their last move with
+class PatternOpponent(Opponent):
+    name = "Local AI"
+
+    def __init__(self, memory: int = 50):
+        """
+        :param memory: Number of recent rounds the transition counts are taken over.
+        """
+        self.memory = memory
+        self.history: List[Move] = []
+
+    def choose(self) -> Move:
+        if len(self.history) < 2:
+            return random.choice(MOVES)
+        recent = self.history[-self.memory:]
+        followers = Counter(after for before, after in zip(recent, recent[1:]) if before == recent[-1])
+        if not followers:
+            return random.choice(MOVES)
+        # The move after the expected one beats it
+        return MOVES[(followers.most_common(1)[0][0] + 1) % 3]
+
+    def record(self, own_move: Move, other_move: Move, outcome: str):
+        self.history.append(other_move)
+
+
+# Moves an LlmOpponent plays when the model fails or is too slow
+LLM_FALLBACKS = ("random", "pattern")
+
+
+# Language model opponent, puts a bounded summary of the rounds played so far in its prompt.
+# Its move only depends on the finished rounds, so the game requests it as soon as the countdown starts
+class LlmOpponent(Opponent):
+    abandonable = True
+
+    def __init__(self, api_key: str, name: str = "AI", prompt: str = LLM_PROMPT, log_name: bool = False,
+                 timeout: Optional[float] = 20.0, fallback: str = "random", history_rounds: int = 20,
+                 history_tokens: Optional[int] = 400):
+        """
+        :param api_key: Token for the inference endpoint.
+        :param name: Name shown for this side.
+        :param prompt: Prompt template with a {history_placeholder}.
+        :param log_name: Store the name with every logged decision, used when two models play each other.
+        :param timeout: Seconds after the request was sent before the fallback move is played, None waits forever.
+                        The request starts with the countdown, so the model gets the countdown on top of the reveal.
+        :param fallback: "random", or "pattern" to play what the local AI would.
+        :param history_rounds: Most recent rounds listed in the prompt, older ones only count towards the statistics.
+        :param history_tokens: Token budget of the history in the prompt, None for no budget.
+        """
+        if fallback not in LLM_FALLBACKS:
+            raise ValueError(f"Unknown fallback: {fallback}. Available: {', '.join(LLM_FALLBACKS)}")
+        self.api_key = api_key
+        self.move_timeout = timeout
+        self.name = name
+        self.prompt = prompt
+        self.log_name = log_name
+        self.history = RoundHistory(recent_rounds=history_rounds, max_tokens=history_tokens)
+        self.fallback = PatternOpponent() if fallback == "pattern" else None
+
+    def prepare(self):
+        # Build the shared client while the title screen is up, the connection opens with the first move
+        from src.inference_client import get_client_manager
+        get_client_manager().client(self.api_key)
+
+    def choose(self, abandoned: Optional[threading.Event] = None) -> Move:
+        from src.decision_log import get_decision_log
+        from src.utils import run_rock_paper_scissors_openai_model, run_rock_paper_scissors_ai_vs_ai_openai_model
+
+        prompt = self.prompt.replace("{history_placeholder}", self.history.render())
+        if self.log_name:
+            response = run_rock_paper_scissors_ai_vs_ai_openai_model(name=self.name, api_key=self.api_key, prompt=prompt,
+                                                                     timeout=self.move_timeout, log=False)
+        else:
+            response = run_rock_paper_scissors_openai_model(api_key=self.api_key, prompt=prompt, timeout=self.move_timeout,
+                                                            log=False)
+        # A late answer was replaced by the fallback move, it was never played
+        if abandoned is None or not abandoned.is_set():
+            get_decision_log().append(response)
+        # Anything but one of the three moves is rejected here instead of reaching the game
+        return Move.parse(response["Choice"])
+
+    def record(self, own_move: Move, other_move: Move, outcome: str):
+        self.history.add(own_move, other_move)
+        if self.fallback is not None:
+            self.fallback.record(own_move, other_move, outcome)
+
+    def fallback_move(self) -> Move:
+        return self.fallback.choose() if self.fallback is not None else super().fallback_move()
+
+    def close(self):
+        from src.inference_client import get_client_manager
+        manager = get_client_manager()
+        if manager.clients:
+            stats = manager.stats()
+            logging.info(
+                f"Inference: {stats['clients']} client(s), {stats['requests']} request(s), setup {stats['setup_ms']:.1f} ms, "
+                f"first request {stats['cold_request_ms']:.1f} ms, later requests {stats['warm_request_ms']:.1f} ms"
+            )
+        manager.close()
+
+
+# The other player of a multiplayer game, connected through the game server
+class NetworkOpponent(Opponent):
+    remote = True
+
+    def __init__(self, host: str, port: int):
+        """
+        Connect to the server, the rest of the protocol runs on the network thread.
+
+        :param host: Server address.
+        :param port: Server port.
+        """
+        from src.network import Network
+
+        self.network = Network(host=host, port=port)
+        self.player_id = self.network.get_player_id()
+        self.name = f"Player {3 - self.player_id}" if self.player_id else "Opponent"
+        # Server messages arrive on the network thread and are handled on the game loop
+        self.messages: queue.Queue = queue.Queue()
+        self.network.set_callback(self.messages.put)
+
+        self.players_connected = 0
+        self.player_ready = False
+        self.opponent_ready = False
+        self.player_scores = {"wins": 0, "losses": 0, "draws": 0}
+        self.opponent_scores = {"wins": 0, "losses": 0, "draws": 0}
+
+    @property
+    def connected(self) -> bool:
+        return bool(self.player_id)
+
+    def request_round(self):
+        """Tell the server this player is ready, the round starts once both are"""
+        self.network.set_ready()
+
+    def submit(self, move: Move):
+        """Send the player's move, the server answers with the result"""
+        self.network.make_choice(move.key)
+
+    def _update_scores(self, data: Dict):
+        scores = data.get("scores", {})
+        player_id, opponent_id = str(self.player_id), str(3 - self.player_id)
+        if player_id in scores:
+            self.player_scores = scores[player_id]
+        if opponent_id in scores:
+            self.opponent_scores = scores[opponent_id]
+
+    def poll(self) -> List[Tuple[str, Optional[Tuple[str, Optional[Move]]]]]:
+        """
+        Handle the server messages received since the last call.
+
+        :return: Round events in arrival order, ("countdown", None), ("round_over", None)
+                 or ("result", (message, opponent_move)).
+        """
+        events = []
+        while True:
+            try:
+                data = self.messages.get_nowait()
+            except queue.Empty:
+                return events
+
+            if data["type"] == "game_state":
+                # Update connection and ready status
+                self.players_connected = data.get("players_connected", 0)
+                ready_players = data.get("ready_players", [])
+                self.player_ready = self.player_id in ready_players
+                self.opponent_ready = (3 - self.player_id) in ready_players
+                self._update_scores(data)
+
+                if not data.get("round_in_progress"):
+                    events.append(("round_over", None))
+                elif data.get("countdown_active"):
+                    events.append(("countdown", None))
+
+            elif data["type"] == "result":
+                self.player_ready = False
+                self._update_scores(data)
+                opponent_move = data.get("choices", {}).get(str(3 - self.player_id))
+                try:
+                    opponent_move = Move.parse(opponent_move)
+                except ValueError:
+                    logging.error(f"Server sent an invalid opponent move: {opponent_move!r}")
+                    opponent_move = None
+                events.append(("result", (data["message"], opponent_move)))
+
+    def labels(self) -> Tuple[str, str]:
+        """Names shown under the two profiles"""
+        return f"Player {self.player_id}", f"Player {3 - self.player_id}"
+
+    def statuses(self) -> Tuple[str, str]:
+        """Ready state shown under the two names"""
+        opponent_status = "Ready" if self.opponent_ready else "Not Ready"
+        if not self.players_connected == 2:
+            opponent_status = "Waiting for opponent..."
+        return "Ready" if self.player_ready else "Not Ready", opponent_status
+
+    def close(self):
+        self.network.disconnect()
+
+
+# Local opponents that can be picked by name on the command line
+OPPONENTS = {
+    "random": RandomOpponent,
+    "pattern": PatternOpponent,
+}
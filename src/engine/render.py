@@ -0,0 +1,189 @@
+import pygame
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from src.engine.assets import GameAssets, PROFILE_SIZE, CHOICE_SIZE
+from src.gestures import Move
+
+# Screen dimensions
+WIDTH, HEIGHT = 800, 600
+
+# Colors
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+GRAY = (200, 200, 200)
+LIGHT_GRAY = (100, 100, 100)
+SHADOW_COLOR = (50, 50, 50, 100)  # Semi-transparent black for shadow
+
+# Score counters in HUD order, with the x offset of their icon from the start of a side
+SCORE_SLOTS = (("wins", 0), ("losses", 80), ("draws", 160))
+
+
+# Rendered text surfaces keyed by font, string and color, so unchanged text is never rendered twice
+class TextCache:
+    def __init__(self, max_entries: int = 256):
+        """
+        :param max_entries: Surfaces kept before the least recently used ones are dropped.
+        """
+        self.max_entries = max_entries
+        self.surfaces: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text: str, color) -> pygame.Surface:
+        key = (font, text, color)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)
+        return surface
+
+
+# Draws the board, the score HUD and the round state for every game mode.
+# The static layer is composed once. Every frame the game declares what each slot shows,
+# and only slots whose content changed are redrawn and pushed to the display
+class Renderer:
+    def __init__(self, screen, assets: GameAssets, divider: bool = False):
+        """
+        :param screen: Display surface.
+        :param assets: Loaded sprites.
+        :param divider: Draw the vertical line between the two players used in multiplayer.
+        """
+        self.screen = screen
+        self.assets = assets
+        self.text_cache = TextCache()
+
+        # Font settings
+        self.font = pygame.font.SysFont(None, 55)
+        self.small_font = pygame.font.SysFont(None, 35)
+
+        self.base = self._compose_static(divider)
+        # slot -> (content key, surface, rect) of what is on screen and of what the current frame wants
+        self.shown: Dict[str, Tuple[tuple, pygame.Surface, pygame.Rect]] = {}
+        self.wanted: Dict[str, Tuple[tuple, pygame.Surface, pygame.Rect]] = {}
+        self.full_redraw = True
+        self.pixels_updated = 0
+
+    def _compose_static(self, divider: bool) -> pygame.Surface:
+        """Background, navbar, profiles and score icons never change, draw them once"""
+        base = pygame.Surface((WIDTH, HEIGHT)).convert()
+        base.blit(self.assets.background, (0, 0))
+
+        # Draw navbar background
+        pygame.draw.rect(base, LIGHT_GRAY, (0, 0, WIDTH, 80))
+
+        # Draw shadow under the navbar
+        pygame.draw.rect(base, SHADOW_COLOR, (0, 80, WIDTH, 10))
+
+        if divider:
+            pygame.draw.line(base, WHITE, (WIDTH // 2, 0), (WIDTH // 2, HEIGHT), 2)
+
+        # Draw profiles in the top corners
+        base.blit(self.assets.user_profile, (20, 5))
+        base.blit(self.assets.computer_profile, (WIDTH - PROFILE_SIZE - 20, 5))
+
+        # Win, loss and draw icons next to each profile, only the counts next to them change
+        icons = {"wins": self.assets.win_icon, "losses": self.assets.loss_icon, "draws": self.assets.draw_icon}
+        for x in (120, WIDTH - 360):
+            for key, offset in SCORE_SLOTS:
+                base.blit(icons[key], (x + offset, 25))
+        return base
+
+    def invalidate(self):
+        """Redraw the whole window on the next present, e.g. after it was uncovered"""
+        self.full_redraw = True
+
+    def _text(self, slot: str, text: Optional[str], font, color, position):
+        """
+        Show text in a slot, or clear the slot when text is empty.
+        position is a (x, y) top left corner, x may be "center" and a negative x is measured from the right edge.
+        """
+        if not text:
+            return
+        surface = self.text_cache.render(font, text, color)
+        x, y = position
+        if x == "center":
+            x = (WIDTH - surface.get_width()) // 2
+        elif x < 0:
+            x = WIDTH + x - surface.get_width()
+        if y == "center":
+            y = (HEIGHT - surface.get_height()) // 2
+        self.wanted[slot] = ((text, id(font), color, x, y), surface, surface.get_rect(topleft=(x, y)))
+
+    def _sprite(self, slot: str, key, surface: Optional[pygame.Surface], position):
+        if surface is None:
+            return
+        self.wanted[slot] = ((key, position), surface, surface.get_rect(topleft=position))
+
+    def draw_scores(self, left: Dict[str, int], right: Dict[str, int]):
+        """Draw metrics (Wins, Losses, Draws) as counts next to the icons under each profile"""
+        for side, scores, x in (("left", left, 120), ("right", right, WIDTH - 360)):
+            for key, offset in SCORE_SLOTS:
+                self._text(f"{side}_{key}", f"x{scores[key]}", self.small_font, BLACK, (x + offset + 30, 25))
+
+    def draw_labels(self, labels: Tuple[str, str], statuses: Tuple[str, str]):
+        """Player names and ready states under the profiles"""
+        for row, name, (left, right) in ((15, "label", labels), (40, "status", statuses)):
+            self._text(f"left_{name}", left, self.small_font, WHITE, (20, PROFILE_SIZE + row))
+            self._text(f"right_{name}", right, self.small_font, WHITE, (-(PROFILE_SIZE + 20), PROFILE_SIZE + row))
+
+    def draw_countdown(self, countdown: int):
+        self._text("countdown", str(countdown), self.font, WHITE, ("center", "center"))
+
+    def draw_choices(self, left: Optional[Move], right: Optional[Move]):
+        """Display both players' choices, the sprite table is indexed by the move"""
+        choices = self.assets.choices
+        if left is not None:
+            self._sprite("left_choice", left, choices[left], (WIDTH // 4 - CHOICE_SIZE // 2, 200))
+        if right is not None:
+            self._sprite("right_choice", right, choices[right], (3 * WIDTH // 4 - CHOICE_SIZE // 2, 200))
+
+    def draw_result(self, result_text: str):
+        self._text("result", result_text, self.font, WHITE, ("center", HEIGHT - 100))
+
+    def draw_prompt(self, prompt: Optional[str]):
+        self._text("prompt", prompt, self.small_font, GRAY, ("center", HEIGHT - 50))
+
+    def present(self) -> List[pygame.Rect]:
+        """
+        Bring the window up to date with the slots drawn this frame and push only the changed regions.
+
+        :return: The rectangles that were updated.
+        """
+        if self.full_redraw:
+            self.screen.blit(self.base, (0, 0))
+            for _, surface, rect in self.wanted.values():
+                self.screen.blit(surface, rect)
+            dirty = [self.screen.get_rect()]
+            pygame.display.update()
+            self.full_redraw = False
+        else:
+            dirty = []
+            for slot in self.shown.keys() | self.wanted.keys():
+                old, new = self.shown.get(slot), self.wanted.get(slot)
+                if old is not None and new is not None and old[0] == new[0]:
+                    continue
+                if old is not None:
+                    dirty.append(old[2])
+                if new is not None:
+                    dirty.append(new[2])
+
+            if dirty:
+                # Restore the static layer under every changed region, then redraw whatever overlaps them
+                for rect in dirty:
+                    self.screen.blit(self.base, rect, rect)
+                for _, surface, rect in self.wanted.values():
+                    if rect.collidelist(dirty) != -1:
+                        self.screen.blit(surface, rect)
+                pygame.display.update(dirty)
+
+        self.pixels_updated += sum(rect.width * rect.height for rect in dirty)
+        self.shown, self.wanted = self.wanted, {}
+        return dirty
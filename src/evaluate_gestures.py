@@ -0,0 +1,223 @@
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+import cv2
+import numpy as np
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.gestures import GESTURE_LABELS, UNKNOWN, gesture_code
+from src.hand_detector import HandDetector
+from src.landmarks import LandmarkBuffer
+from src.gesture_classifiers import get_classifier
+from src.gesture_model import DEFAULT_MODEL_PATH
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".webp")
+STAGES = ("decode", "convert", "inference", "classify")
+
+# Per process state, set up once by the pool initializer
+_detector: Optional[HandDetector] = None
+_classifier = None
+_buffer: Optional[LandmarkBuffer] = None
+
+
+def _init_worker(classifier_name: str, weights_path: str, min_detection_confidence: float):
+    global _detector, _classifier, _buffer
+    _detector = HandDetector(static_image_mode=True, min_detection_confidence=min_detection_confidence)
+    if classifier_name == "learned":
+        _classifier = get_classifier(classifier_name, weights_path=weights_path)
+    else:
+        _classifier = get_classifier(classifier_name)
+    _buffer = LandmarkBuffer()
+
+
+def _classify_frame(bgr: np.ndarray, label: int, decode_time: float) -> Tuple:
+    """Run one decoded frame through the pipeline, returning (label, prediction, stage times in ms)"""
+    start = time.perf_counter()
+    rgb = cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+    converted = time.perf_counter()
+    result = _detector.process(rgb)
+    inferred = time.perf_counter()
+
+    prediction = UNKNOWN
+    if result.multi_hand_landmarks:
+        prediction = int(_classifier.predict(_buffer.from_result(result)[:1])[0])
+    classified = time.perf_counter()
+
+    return (label, prediction, decode_time * 1000, (converted - start) * 1000, (inferred - converted) * 1000, (classified - inferred) * 1000)
+
+
+def _evaluate_images(items: List[Tuple[str, int]]) -> List[Tuple]:
+    rows = []
+    for path, label in items:
+        start = time.perf_counter()
+        bgr = cv2.imread(path)
+        decode_time = time.perf_counter() - start
+        if bgr is None:
+            continue
+        rows.append(_classify_frame(bgr, label, decode_time))
+    return rows
+
+
+def _evaluate_video(video_path: str, start_frame: int, end_frame: int, every: int, labels: Dict[int, int]) -> List[Tuple]:
+    rows = []
+    capture = cv2.VideoCapture(video_path)
+    capture.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+    for index in range(start_frame, end_frame):
+        start = time.perf_counter()
+        ok, bgr = capture.read()
+        decode_time = time.perf_counter() - start
+        if not ok:
+            break
+        if (index % every) == 0 and index in labels:
+            rows.append(_classify_frame(bgr, labels[index], decode_time))
+    capture.release()
+    return rows
+
+
+def load_image_items(folder: str, manifest: Optional[str]) -> List[Tuple[str, int]]:
+    """
+    List labelled images, either from a "path,label" manifest relative to the folder
+    or from sub folders named after the gesture (folder/rock/1.jpg).
+    """
+    items = []
+    if manifest:
+        with open(manifest, "r", newline="") as file:
+            for row in csv.DictReader(file):
+                items.append((os.path.join(folder, row["path"]), gesture_code(row["label"])))
+        return items
+
+    for label in os.listdir(folder):
+        sub_folder = os.path.join(folder, label)
+        if os.path.isdir(sub_folder):
+            for name in sorted(os.listdir(sub_folder)):
+                if name.lower().endswith(IMAGE_EXTENSIONS):
+                    items.append((os.path.join(sub_folder, name), gesture_code(label)))
+    return items
+
+
+def load_video_labels(video_path: str, manifest: Optional[str], label: Optional[str]) -> Tuple[int, Dict[int, int]]:
+    """
+    Frame labels for a video, from a "frame,label" or "start,end,label" manifest, or one label for every frame.
+
+    :return: The frame count and a frame index to gesture code mapping.
+    """
+    capture = cv2.VideoCapture(video_path)
+    frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+    capture.release()
+
+    if not manifest:
+        return frame_count, {index: gesture_code(label) for index in range(frame_count)}
+
+    labels = {}
+    with open(manifest, "r", newline="") as file:
+        for row in csv.DictReader(file):
+            if "frame" in row:
+                labels[int(row["frame"])] = gesture_code(row["label"])
+            else:
+                for index in range(int(row["start"]), int(row["end"]) + 1):
+                    labels[index] = gesture_code(row["label"])
+    return frame_count, labels
+
+
+def confusion_matrix(labels: np.ndarray, predictions: np.ndarray) -> np.ndarray:
+    """Rows are the true gesture, columns the prediction, both indexed by gesture code"""
+    matrix = np.zeros((len(GESTURE_LABELS), len(GESTURE_LABELS)), dtype=np.int64)
+    np.add.at(matrix, (labels, predictions), 1)
+    return matrix
+
+
+def summarize(rows: List[Tuple], wall_time: float) -> Dict:
+    """Throughput, stage latency percentiles, accuracy and confusion matrix of an evaluation run"""
+    data = np.array(rows, dtype=np.float64).reshape(-1, 2 + len(STAGES))
+    labels = data[:, 0].astype(np.int64)
+    predictions = data[:, 1].astype(np.int64)
+    report = {
+        "frames": len(rows),
+        "wall_time_s": wall_time,
+        "frames_per_second": len(rows) / wall_time if wall_time else 0.0,
+        "accuracy": float(np.mean(labels == predictions)) if len(rows) else 0.0,
+        "stages_ms": {},
+        "confusion_matrix": confusion_matrix(labels, predictions).tolist(),
+    }
+    for column, stage in enumerate(STAGES, start=2):
+        times = data[:, column]
+        if len(times):
+            report["stages_ms"][stage] = {f"p{p}": float(np.percentile(times, p)) for p in (50, 90, 99)}
+    return report
+
+
+def print_report(report: Dict):
+    print(f"Frames: {report['frames']}   wall time: {report['wall_time_s']:.2f} s   throughput: {report['frames_per_second']:.1f} frames/s")
+    print(f"Accuracy: {report['accuracy']:.3f}\n")
+
+    print(f"{'stage':<10} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9}")
+    for stage, percentiles in report["stages_ms"].items():
+        print(f"{stage:<10} {percentiles['p50']:9.2f} {percentiles['p90']:9.2f} {percentiles['p99']:9.2f}")
+
+    print("\nConfusion matrix (rows: true, columns: predicted)")
+    print(" " * 10 + "".join(f"{label:>10}" for label in GESTURE_LABELS))
+    for label, row in zip(GESTURE_LABELS, report["confusion_matrix"]):
+        print(f"{label:<10}" + "".join(f"{count:>10}" for count in row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate gesture detection speed and accuracy on labelled images or a video.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--images", help="Folder of images, labelled by a manifest or by gesture named sub folders.")
+    source.add_argument("--video", help="Video file to evaluate frame by frame.")
+    parser.add_argument("--manifest", help="CSV with path,label (images) or frame,label / start,end,label (video) columns.")
+    parser.add_argument("--label", help="Label every video frame with this gesture when there is no manifest.")
+    parser.add_argument("--every", type=int, default=1, help="Only evaluate every n-th video frame.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes.")
+    parser.add_argument("--chunk-size", type=int, default=32, help="Images or video frames per task.")
+    parser.add_argument("--classifier", default="features", choices=["rules", "features", "learned"])
+    parser.add_argument("--weights", default=DEFAULT_MODEL_PATH, help="Weights for the learned classifier.")
+    parser.add_argument("--min-detection-confidence", type=float, default=0.7)
+    parser.add_argument("--json", help="Also write the report to this JSON file.")
+    args = parser.parse_args()
+
+    if args.video and not (args.manifest or args.label):
+        parser.error("--video needs a --manifest or a --label")
+
+    start = time.perf_counter()
+    rows = []
+    with ProcessPoolExecutor(
+        max_workers=args.workers,
+        initializer=_init_worker,
+        initargs=(args.classifier, args.weights, args.min_detection_confidence),
+    ) as pool:
+        if args.images:
+            items = load_image_items(args.images, args.manifest)
+            chunks = [items[i:i + args.chunk_size] for i in range(0, len(items), args.chunk_size)]
+            futures = [pool.submit(_evaluate_images, chunk) for chunk in chunks]
+        else:
+            frame_count, labels = load_video_labels(args.video, args.manifest, args.label)
+            futures = [
+                pool.submit(_evaluate_video, args.video, first, min(first + args.chunk_size * args.every, frame_count), args.every, labels)
+                for first in range(0, frame_count, args.chunk_size * args.every)
+            ]
+        for future in futures:
+            rows.extend(future.result())
+    wall_time = time.perf_counter() - start
+
+    report = summarize(rows, wall_time)
+    report["classifier"] = args.classifier
+    report["workers"] = args.workers
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
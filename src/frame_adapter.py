@@ -0,0 +1,89 @@
+import threading
+import cv2
+import numpy as np
+from typing import Optional, Tuple
+
+
+# Counts the work spent per frame so conversion changes can be measured
+class FrameStats:
+    def __init__(self):
+        self.frames = 0
+        self.copies = 0
+        self.allocations = 0
+        self.lock = threading.Lock()
+
+    def record(self, copies: int, allocations: int):
+        with self.lock:
+            self.frames += 1
+            self.copies += copies
+            self.allocations += allocations
+
+    def per_frame(self) -> Tuple[float, float]:
+        """Average (copies, allocations) per converted frame"""
+        with self.lock:
+            if self.frames == 0:
+                return 0.0, 0.0
+            return self.copies / self.frames, self.allocations / self.frames
+
+    def reset(self):
+        with self.lock:
+            self.frames = self.copies = self.allocations = 0
+
+
+# Turns camera frames into contiguous (height, width, 3) RGB arrays, the layout Mediapipe expects
+class FrameAdapter:
+    def __init__(self, width: int = 640, height: int = 480):
+        """
+        :param width: Frame width in pixels.
+        :param height: Frame height in pixels.
+        """
+        self.width = width
+        self.height = height
+        self.rgb = np.empty((height, width, 3), dtype=np.uint8)
+        self.stats = FrameStats()
+
+    def _target(self, out: Optional[np.ndarray], default: np.ndarray, shape) -> Tuple[np.ndarray, int]:
+        """Pick the output array, returning how many arrays had to be allocated"""
+        if out is not None:
+            return out, 0
+        if default.shape == shape:
+            return default, 0
+        return np.empty(shape, dtype=np.uint8), 1
+
+    @staticmethod
+    def surface_view(surface) -> np.ndarray:
+        """
+        (height, width, 3) RGB view of a 24 or 32 bit pygame surface without copying.
+        The view is not contiguous and keeps the surface locked until it is released.
+        """
+        import pygame
+        return pygame.surfarray.pixels3d(surface).transpose(1, 0, 2)
+
+    def from_surface(self, surface, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Copy a pygame surface into a contiguous RGB array in a single pass.
+        Replaces array3d (copy) + transpose + cvtColor (second copy and allocation).
+
+        :param surface: Camera surface.
+        :param out: (height, width, 3) uint8 array to fill, defaults to the adapter's own buffer.
+        :return: The filled RGB array.
+        """
+        view = self.surface_view(surface)
+        target, allocations = self._target(out, self.rgb, view.shape)
+        np.copyto(target, view)
+        del view  # release the surface lock
+        self.stats.record(copies=1, allocations=allocations)
+        return target
+
+    def from_bgr(self, frame: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Convert an OpenCV BGR frame to RGB in one pass into a reused array.
+
+        :param frame: (height, width, 3) BGR frame from cv2.VideoCapture.
+        :param out: (height, width, 3) uint8 array to fill, defaults to the adapter's own buffer.
+        :return: The filled RGB array.
+        """
+        target, allocations = self._target(out, self.rgb, frame.shape)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=target)
+        self.stats.record(copies=1, allocations=allocations)
+        return target
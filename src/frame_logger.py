@@ -0,0 +1,167 @@
+import os
+import time
+import queue
+import logging
+import datetime
+import threading
+from collections import deque
+from typing import Optional
+import cv2
+import numpy as np
+
+# Encoder settings per supported image format
+ENCODE_PARAMS = {
+    "jpg": lambda quality: [cv2.IMWRITE_JPEG_QUALITY, quality],
+    "webp": lambda quality: [cv2.IMWRITE_WEBP_QUALITY, quality],
+    "png": lambda quality: [cv2.IMWRITE_PNG_COMPRESSION, 1],
+}
+
+
+# Writes annotated frames from a worker thread so the game loop never waits on encoding or disk
+class AsyncFrameLogger:
+    def __init__(
+            self,
+            folder: str = "logs",
+            prefix: str = "gesture",
+            image_format: str = "jpg",
+            quality: int = 85,
+            scale: float = 1.0,
+            max_queue: int = 4,
+            max_files: Optional[int] = 200,
+            max_bytes: Optional[int] = 50 * 1024 * 1024,
+            max_age_seconds: Optional[float] = None,
+            sample_every: int = 1
+        ):
+        """
+        Start the logging worker.
+
+        :param folder: Folder the images are written to.
+        :param prefix: File name prefix, also used to find old files for rotation.
+        :param image_format: One of "jpg", "webp" or "png".
+        :param quality: JPEG/WebP quality from 0 to 100.
+        :param scale: Downscale factor applied before encoding, 1.0 keeps full resolution.
+        :param max_queue: Frames waiting to be written, newer frames are dropped when it is full.
+        :param max_files: Keep at most this many images, None for no limit.
+        :param max_bytes: Keep at most this many bytes of images, None for no limit.
+        :param max_age_seconds: Delete images older than this, None for no limit.
+        :param sample_every: Only keep every n-th frame offered through wants_frame.
+        """
+        if image_format not in ENCODE_PARAMS:
+            raise ValueError(f"Unsupported image format: {image_format}")
+
+        self.folder = folder
+        self.prefix = prefix
+        self.image_format = image_format
+        self.encode_params = ENCODE_PARAMS[image_format](quality)
+        self.scale = scale
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.sample_every = max(1, sample_every)
+        self.offered = 0
+        self.sequence = 0
+
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+
+        # Files on disk, oldest first, as (path, size, mtime)
+        os.makedirs(folder, exist_ok=True)
+        self.files: deque = deque(self._scan())
+        self.total_bytes = sum(size for _, size, _ in self.files)
+
+        self.thread = threading.Thread(target=self._run, name="frame-logger")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _scan(self):
+        """Find images left by earlier sessions so they count towards the retention limits"""
+        entries = []
+        for name in os.listdir(self.folder):
+            if name.startswith(self.prefix + "_"):
+                path = os.path.join(self.folder, name)
+                stat = os.stat(path)
+                entries.append((path, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda entry: entry[2])
+        return entries
+
+    def wants_frame(self) -> bool:
+        """Advance the sampling counter and tell the caller whether to annotate and submit this frame"""
+        self.offered += 1
+        return (self.offered - 1) % self.sample_every == 0
+
+    def submit(self, image: np.ndarray, name: Optional[str] = None) -> bool:
+        """
+        Queue a BGR image for writing without blocking.
+
+        :param image: The image, ownership passes to the logger so the caller must not modify it afterwards.
+        :param name: File name without extension, defaults to the prefix and a timestamp.
+        :return: False if the frame was dropped because the worker is behind.
+        """
+        if name is None:
+            # Microseconds plus a sequence number, so two frames in the same second never share a name
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            name = f"{self.prefix}_{timestamp}_{self.sequence:04d}"
+            self.sequence = (self.sequence + 1) % 10000
+        try:
+            self.queue.put_nowait((image, name))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:
+                self.errors += 1
+                logging.error(f"Frame logger error: {str(e)}")
+            finally:
+                self.queue.task_done()
+
+    def _write(self, image: np.ndarray, name: str):
+        if self.scale != 1.0:
+            image = cv2.resize(image, None, fx=self.scale, fy=self.scale, interpolation=cv2.INTER_AREA)
+
+        ok, encoded = cv2.imencode(f".{self.image_format}", image, self.encode_params)
+        if not ok:
+            raise ValueError(f"Could not encode frame as {self.image_format}")
+
+        path = os.path.join(self.folder, f"{name}.{self.image_format}")
+        encoded.tofile(path)
+        self.written += 1
+
+        self.files.append((path, encoded.size, time.time()))
+        self.total_bytes += encoded.size
+        self._rotate()
+
+    def _rotate(self):
+        """Delete the oldest images until the retention limits hold"""
+        now = time.time()
+        while self.files:
+            path, size, mtime = self.files[0]
+            too_many = self.max_files is not None and len(self.files) > self.max_files
+            too_big = self.max_bytes is not None and self.total_bytes > self.max_bytes
+            too_old = self.max_age_seconds is not None and now - mtime > self.max_age_seconds
+            if not (too_many or too_big or too_old):
+                break
+            self.files.popleft()
+            self.total_bytes -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def flush(self):
+        """Block until every queued frame has been written"""
+        self.queue.join()
+
+    def close(self, timeout: float = 5.0):
+        """Write the remaining frames and stop the worker"""
+        self.queue.put(None)
+        self.thread.join(timeout=timeout)
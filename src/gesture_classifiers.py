@@ -0,0 +1,107 @@
+import numpy as np
+from typing import Dict, Type
+
+from src.gestures import ROCK, PAPER, SCISSORS, UNKNOWN
+from src.landmarks import as_landmark_array, classify_landmarks_array
+from src.gesture_features import extract_features, DEFAULT_ASPECT_RATIO
+
+# Number of real gestures, UNKNOWN is not a class
+NUM_CLASSES = 3
+
+
+# Interface every gesture classifier implements, instances can be passed wherever a classify function is expected
+class GestureClassifier:
+    name = "base"
+
+    def predict(self, landmarks) -> np.ndarray:
+        """
+        Classify a batch of hands.
+
+        :param landmarks: (N, 21, 3) or (21, 3) landmarks.
+        :return: (N,) int8 gesture codes from src.gestures.
+        """
+        raise NotImplementedError
+
+    def predict_proba(self, landmarks) -> np.ndarray:
+        """
+        Probability of Rock, Paper and Scissors for every hand, classifiers without scores return one-hot rows
+        and a uniform row for hands they cannot classify.
+
+        :param landmarks: (N, 21, 3) or (21, 3) landmarks.
+        :return: (N, 3) float32 probabilities.
+        """
+        codes = self.predict(landmarks)
+        proba = np.full((len(codes), NUM_CLASSES), 1 / NUM_CLASSES, dtype=np.float32)
+        known = codes != UNKNOWN
+        proba[known] = np.eye(NUM_CLASSES, dtype=np.float32)[codes[known]]
+        return proba
+
+    def __call__(self, landmarks) -> np.ndarray:
+        return self.predict(landmarks)
+
+
+# The original tip above joint rules, only reliable for upright hands
+class RuleClassifier(GestureClassifier):
+    name = "rules"
+
+    def predict(self, landmarks) -> np.ndarray:
+        return classify_landmarks_array(landmarks)
+
+
+# The same finger patterns, but decided on rotation and scale invariant features
+class FeatureRuleClassifier(GestureClassifier):
+    name = "features"
+
+    def __init__(self, bend_threshold: float = 0.5, extension_threshold: float = 1.15, aspect_ratio: float = DEFAULT_ASPECT_RATIO):
+        """
+        :param bend_threshold: Minimum cosine of the bend at both finger joints for a finger to count as straight.
+        :param extension_threshold: Minimum tip to wrist distance relative to the lower joint to wrist distance.
+        :param aspect_ratio: Frame width divided by frame height.
+        """
+        self.bend_threshold = bend_threshold
+        self.extension_threshold = extension_threshold
+        self.aspect_ratio = aspect_ratio
+
+    def fingers_extended(self, landmarks) -> np.ndarray:
+        """(N, 5) booleans for thumb, index, middle, ring and pinky"""
+        features = extract_features(landmarks, self.aspect_ratio)
+        lower_bend = features[:, 0:5]
+        upper_bend = features[:, 5:10]
+        extension = features[:, 15:20]
+        return (lower_bend > self.bend_threshold) & (upper_bend > self.bend_threshold) & (extension > self.extension_threshold)
+
+    def predict(self, landmarks) -> np.ndarray:
+        landmarks = as_landmark_array(landmarks)
+        extended = self.fingers_extended(landmarks)[:, 1:]  # the thumb is ignored like in the original rules
+
+        codes = np.full(len(landmarks), UNKNOWN, dtype=np.int8)
+        codes[extended.all(axis=1)] = PAPER
+        codes[extended[:, 0] & extended[:, 1] & ~extended[:, 2] & ~extended[:, 3]] = SCISSORS
+        codes[~extended.any(axis=1)] = ROCK
+        return codes
+
+
+# Classifiers that can be selected by name
+CLASSIFIERS: Dict[str, Type[GestureClassifier]] = {
+    RuleClassifier.name: RuleClassifier,
+    FeatureRuleClassifier.name: FeatureRuleClassifier,
+}
+
+
+def register_classifier(classifier_class: Type[GestureClassifier]) -> Type[GestureClassifier]:
+    """Make a classifier available to get_classifier under its name, usable as a class decorator"""
+    CLASSIFIERS[classifier_class.name] = classifier_class
+    return classifier_class
+
+
+def get_classifier(name: str = "features", **options) -> GestureClassifier:
+    """
+    Create a classifier by name.
+
+    :param name: A key of CLASSIFIERS, e.g. "rules" or "features".
+    :param options: Passed to the classifier constructor.
+    :return: The classifier.
+    """
+    if name not in CLASSIFIERS:
+        raise ValueError(f"Unknown gesture classifier: {name}. Available: {', '.join(sorted(CLASSIFIERS))}")
+    return CLASSIFIERS[name](**options)
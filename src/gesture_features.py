@@ -0,0 +1,100 @@
+import numpy as np
+
+from src.landmarks import as_landmark_array
+
+# Landmark chains from the base of each finger to its tip: thumb, index, middle, ring, pinky
+FINGER_CHAINS = np.array([
+    [1, 2, 3, 4],
+    [5, 6, 7, 8],
+    [9, 10, 11, 12],
+    [13, 14, 15, 16],
+    [17, 18, 19, 20],
+])
+FINGERS = ("thumb", "index", "middle", "ring", "pinky")
+PALM = np.array([0, 5, 9, 13, 17])
+WRIST = 0
+MIDDLE_MCP = 9
+
+FEATURE_NAMES = (
+    [f"{finger}_lower_bend" for finger in FINGERS]
+    + [f"{finger}_upper_bend" for finger in FINGERS]
+    + [f"{finger}_tip_to_palm" for finger in FINGERS]
+    + [f"{finger}_extension" for finger in FINGERS]
+)
+
+# Mediapipe x and y are normalized by frame width and height, this undoes that for a 640x480 camera
+DEFAULT_ASPECT_RATIO = 640 / 480
+
+EPS = 1e-6
+
+
+def _to_metric(landmarks, aspect_ratio: float) -> np.ndarray:
+    """Copy landmarks with x stretched so x and y share a unit, otherwise angles change as the hand rotates"""
+    points = as_landmark_array(landmarks).copy()
+    points[:, :, 0] *= aspect_ratio
+    return points
+
+
+def _norm(vectors: np.ndarray) -> np.ndarray:
+    return np.sqrt(np.einsum("...i,...i->...", vectors, vectors))
+
+
+def _cos_between(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    return np.einsum("...i,...i->...", first, second) / (_norm(first) * _norm(second) + EPS)
+
+
+def canonicalize_landmarks(landmarks, aspect_ratio: float = DEFAULT_ASPECT_RATIO) -> np.ndarray:
+    """
+    Remove position, size and in-plane rotation from the hands.
+    The wrist ends up at the origin and the middle finger knuckle at (0, -1), pointing up like an upright hand.
+
+    :param landmarks: (N, 21, 3) or (21, 3) landmarks.
+    :param aspect_ratio: Frame width divided by frame height.
+    :return: (N, 21, 3) float32 canonical landmarks.
+    """
+    points = _to_metric(landmarks, aspect_ratio)
+    points -= points[:, WRIST:WRIST + 1]
+
+    palm_size = _norm(points[:, MIDDLE_MCP]) + EPS
+    points /= palm_size[:, np.newaxis, np.newaxis]
+
+    # Rotate the wrist to knuckle direction u onto (0, -1)
+    direction = points[:, MIDDLE_MCP, :2]
+    direction = direction / (_norm(direction)[:, np.newaxis] + EPS)
+    ux = direction[:, 0:1]
+    uy = direction[:, 1:2]
+    x = points[:, :, 0].copy()
+    y = points[:, :, 1].copy()
+    points[:, :, 0] = -uy * x + ux * y
+    points[:, :, 1] = -ux * x - uy * y
+    return points
+
+
+def extract_features(landmarks, aspect_ratio: float = DEFAULT_ASPECT_RATIO) -> np.ndarray:
+    """
+    Rotation and scale invariant features for every hand, in the order of FEATURE_NAMES:
+    the cosine of the bend at the lower and upper joint of each finger (1 is straight),
+    the tip distance to the palm centre in palm sizes,
+    and the tip distance to the wrist relative to the lower joint distance to the wrist.
+
+    :param landmarks: (N, 21, 3) or (21, 3) landmarks.
+    :param aspect_ratio: Frame width divided by frame height.
+    :return: (N, 20) float32 features.
+    """
+    points = _to_metric(landmarks, aspect_ratio)
+
+    base = points[:, FINGER_CHAINS[:, 0]]
+    lower = points[:, FINGER_CHAINS[:, 1]]
+    upper = points[:, FINGER_CHAINS[:, 2]]
+    tip = points[:, FINGER_CHAINS[:, 3]]
+
+    lower_bend = _cos_between(lower - base, upper - lower)
+    upper_bend = _cos_between(upper - lower, tip - upper)
+
+    wrist = points[:, WRIST:WRIST + 1]
+    palm_size = _norm(points[:, MIDDLE_MCP] - points[:, WRIST]) + EPS
+    palm_centre = points[:, PALM].mean(axis=1, keepdims=True)
+    tip_to_palm = _norm(tip - palm_centre) / palm_size[:, np.newaxis]
+    extension = _norm(tip - wrist) / (_norm(lower - wrist) + EPS)
+
+    return np.concatenate([lower_bend, upper_bend, tip_to_palm, extension], axis=1).astype(np.float32)
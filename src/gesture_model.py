@@ -0,0 +1,259 @@
+import os
+import sys
+import argparse
+import numpy as np
+from typing import List, Optional, Tuple
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.gestures import UNKNOWN, GESTURE_LABELS, gesture_code
+from src.gesture_features import extract_features, canonicalize_landmarks, DEFAULT_ASPECT_RATIO
+from src.gesture_classifiers import GestureClassifier, NUM_CLASSES, register_classifier, get_classifier
+
+MODEL_VERSION = 1
+DEFAULT_MODEL_PATH = "models/gesture_model.npz"
+DEFAULT_LOG_PATH = "logs/detections.rpsd"
+# Printed when a detection log is missing, e.g. on a fresh checkout
+RECORD_LOG_HINT = f"record a detection log first (play a few rounds, every detected gesture is appended to {DEFAULT_LOG_PATH})"
+
+
+def model_inputs(landmarks, aspect_ratio: float = DEFAULT_ASPECT_RATIO) -> np.ndarray:
+    """
+    Input vector of the learned model: the invariant features followed by the canonical landmark coordinates.
+
+    :param landmarks: (N, 21, 3) or (21, 3) landmarks.
+    :param aspect_ratio: Frame width divided by frame height.
+    :return: (N, 83) float32 inputs.
+    """
+    features = extract_features(landmarks, aspect_ratio)
+    canonical = canonicalize_landmarks(landmarks, aspect_ratio).reshape(len(features), -1)
+    return np.concatenate([features, canonical], axis=1)
+
+
+# Small CPU only model, logistic regression or a one hidden layer MLP, trained and run with NumPy
+@register_classifier
+class LearnedGestureClassifier(GestureClassifier):
+    name = "learned"
+
+    def __init__(self, weights_path: Optional[str] = None, min_confidence: float = 0.6, aspect_ratio: float = DEFAULT_ASPECT_RATIO):
+        """
+        :param weights_path: Weights file written by save, leave empty to train from scratch.
+        :param min_confidence: Hands whose best class probability is lower are reported as Unknown.
+        :param aspect_ratio: Frame width divided by frame height, overwritten by the weights file.
+        """
+        self.min_confidence = min_confidence
+        self.aspect_ratio = aspect_ratio
+        self.layers: List[Tuple[np.ndarray, np.ndarray]] = []
+        self.mean = None
+        self.std = None
+        if weights_path:
+            self.load(weights_path)
+
+    def _forward(self, inputs: np.ndarray) -> np.ndarray:
+        activations = (inputs - self.mean) / self.std
+        for weights, bias in self.layers[:-1]:
+            activations = np.maximum(activations @ weights + bias, 0)
+        weights, bias = self.layers[-1]
+        logits = activations @ weights + bias
+        logits -= logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict_proba(self, landmarks) -> np.ndarray:
+        if not self.layers:
+            raise RuntimeError("LearnedGestureClassifier has no weights, train or load it first.")
+        return self._forward(model_inputs(landmarks, self.aspect_ratio)).astype(np.float32)
+
+    def predict(self, landmarks) -> np.ndarray:
+        proba = self.predict_proba(landmarks)
+        codes = proba.argmax(axis=1).astype(np.int8)
+        codes[proba.max(axis=1) < self.min_confidence] = UNKNOWN
+        return codes
+
+    def fit(
+            self,
+            landmarks: np.ndarray,
+            labels: np.ndarray,
+            hidden: int = 16,
+            epochs: int = 500,
+            learning_rate: float = 0.01,
+            weight_decay: float = 1e-4,
+            seed: int = 0
+        ) -> List[float]:
+        """
+        Train with full batch Adam on softmax cross entropy.
+
+        :param landmarks: (N, 21, 3) training hands.
+        :param labels: (N,) gesture codes, only Rock, Paper and Scissors.
+        :param hidden: Hidden layer width, 0 trains plain logistic regression.
+        :param epochs: Number of full batch updates.
+        :param learning_rate: Adam step size.
+        :param weight_decay: L2 penalty on the weights.
+        :param seed: Seed for the weight initialisation.
+        :return: The loss after every epoch.
+        """
+        labels = np.asarray(labels)
+        if np.any((labels < 0) | (labels >= NUM_CLASSES)):
+            raise ValueError("Training labels must be Rock, Paper or Scissors codes.")
+
+        inputs = model_inputs(landmarks, self.aspect_ratio).astype(np.float64)
+        self.mean = inputs.mean(axis=0)
+        self.std = inputs.std(axis=0) + 1e-6
+        inputs = (inputs - self.mean) / self.std
+        targets = np.eye(NUM_CLASSES)[labels]
+
+        rng = np.random.default_rng(seed)
+        sizes = [inputs.shape[1]] + ([hidden] if hidden else []) + [NUM_CLASSES]
+        params = []
+        for fan_in, fan_out in zip(sizes[:-1], sizes[1:]):
+            params.append(rng.normal(0, np.sqrt(2 / fan_in), (fan_in, fan_out)))
+            params.append(np.zeros(fan_out))
+
+        moments = [np.zeros_like(param) for param in params]
+        velocities = [np.zeros_like(param) for param in params]
+        beta1, beta2 = 0.9, 0.999
+        losses = []
+
+        for epoch in range(1, epochs + 1):
+            # Forward pass, keeping the activations for backprop
+            activations = [inputs]
+            for layer in range(0, len(params) - 2, 2):
+                activations.append(np.maximum(activations[-1] @ params[layer] + params[layer + 1], 0))
+            logits = activations[-1] @ params[-2] + params[-1]
+            logits -= logits.max(axis=1, keepdims=True)
+            proba = np.exp(logits)
+            proba /= proba.sum(axis=1, keepdims=True)
+            losses.append(float(-np.mean(np.sum(targets * np.log(proba + 1e-12), axis=1))))
+
+            # Backward pass
+            grads = [None] * len(params)
+            delta = (proba - targets) / len(inputs)
+            for layer in range(len(params) - 2, -1, -2):
+                grads[layer] = activations[layer // 2].T @ delta + weight_decay * params[layer]
+                grads[layer + 1] = delta.sum(axis=0)
+                if layer:
+                    delta = (delta @ params[layer].T) * (activations[layer // 2] > 0)
+
+            for index, grad in enumerate(grads):
+                moments[index] = beta1 * moments[index] + (1 - beta1) * grad
+                velocities[index] = beta2 * velocities[index] + (1 - beta2) * grad ** 2
+                step = moments[index] / (1 - beta1 ** epoch)
+                scale = np.sqrt(velocities[index] / (1 - beta2 ** epoch)) + 1e-8
+                params[index] -= learning_rate * step / scale
+
+        self.layers = [(params[i].astype(np.float32), params[i + 1].astype(np.float32)) for i in range(0, len(params), 2)]
+        self.mean = self.mean.astype(np.float32)
+        self.std = self.std.astype(np.float32)
+        return losses
+
+    def save(self, weights_path: str = DEFAULT_MODEL_PATH):
+        """Write the model to a single compressed .npz file"""
+        os.makedirs(os.path.dirname(weights_path) or ".", exist_ok=True)
+        arrays = {"version": np.array(MODEL_VERSION), "aspect_ratio": np.array(self.aspect_ratio), "mean": self.mean, "std": self.std}
+        for index, (weights, bias) in enumerate(self.layers):
+            arrays[f"weights_{index}"] = weights
+            arrays[f"bias_{index}"] = bias
+        np.savez_compressed(weights_path, **arrays)
+
+    def load(self, weights_path: str = DEFAULT_MODEL_PATH):
+        """Read a model written by save"""
+        with np.load(weights_path) as data:
+            if int(data["version"]) != MODEL_VERSION:
+                raise ValueError(f"{weights_path} is gesture model version {int(data['version'])}, expected {MODEL_VERSION}.")
+            self.aspect_ratio = float(data["aspect_ratio"])
+            self.mean = data["mean"]
+            self.std = data["std"]
+            self.layers = []
+            index = 0
+            while f"weights_{index}" in data.files:
+                self.layers.append((data[f"weights_{index}"], data[f"bias_{index}"]))
+                index += 1
+
+
+def load_game_classifier(weights_path: str = DEFAULT_MODEL_PATH) -> GestureClassifier:
+    """Use the learned model when one has been trained, otherwise the feature rules"""
+    if os.path.exists(weights_path):
+        return get_classifier(LearnedGestureClassifier.name, weights_path=weights_path)
+    return get_classifier("features")
+
+
+def load_training_data(log_paths: List[str], labels_path: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Collect labelled hands from detection logs.
+
+    :param log_paths: Detection logs written by the game.
+    :param labels_path: Optional CSV of "round,gesture" lines that override the logged gestures, useful when the
+                        logged gestures are wrong. Round numbers refer to a single log, so only one log may be given with it.
+    :return: (N, 21, 3) landmarks and (N,) gesture codes.
+    """
+    from src.detection_log import read_detection_log
+
+    if labels_path and len(log_paths) > 1:
+        raise ValueError("A labels file corrects a single detection log, pass only one log with it.")
+    missing = [log_path for log_path in log_paths if not os.path.exists(log_path)]
+    if missing:
+        raise FileNotFoundError(f"No detection log at {', '.join(missing)}, {RECORD_LOG_HINT}.")
+
+    all_landmarks, all_labels = [], []
+    for log_path in log_paths:
+        records = read_detection_log(log_path)
+        labels = np.array(records["gesture"], dtype=np.int64)
+        if labels_path:
+            with open(labels_path, "r") as file:
+                for line in file:
+                    if "," in line and not line.startswith("round"):
+                        round_index, gesture = line.strip().split(",", 1)
+                        labels[int(round_index)] = gesture_code(gesture)
+        keep = (records["hand_found"] == 1) & (labels != UNKNOWN)
+        all_landmarks.append(np.asarray(records["landmarks"][keep]))
+        all_labels.append(labels[keep])
+    return np.concatenate(all_landmarks), np.concatenate(all_labels)
+
+
+def split_data(landmarks: np.ndarray, labels: np.ndarray, validation: float = 0.2, seed: int = 0):
+    """Shuffle and split into training and validation sets"""
+    order = np.random.default_rng(seed).permutation(len(labels))
+    cut = int(len(labels) * (1 - validation))
+    return landmarks[order[:cut]], labels[order[:cut]], landmarks[order[cut:]], labels[order[cut:]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the learned gesture classifier on logged landmarks.")
+    parser.add_argument("--log", nargs="+", default=[DEFAULT_LOG_PATH], help="Detection logs to train on.")
+    parser.add_argument("--labels", help="CSV of round,gesture corrections, only with a single --log.")
+    parser.add_argument("--out", default=DEFAULT_MODEL_PATH, help="Where to write the weights.")
+    parser.add_argument("--hidden", type=int, default=16, help="Hidden layer width, 0 for logistic regression.")
+    parser.add_argument("--epochs", type=int, default=500)
+    parser.add_argument("--learning-rate", type=float, default=0.01)
+    parser.add_argument("--validation", type=float, default=0.2, help="Share of the hands held out for validation.")
+    args = parser.parse_args()
+    if args.labels and len(args.log) > 1:
+        parser.error("--labels corrects a single detection log, pass only one --log with it.")
+
+    try:
+        landmarks, labels = load_training_data(args.log, args.labels)
+    except FileNotFoundError as e:
+        print(e)
+        return
+    if len(labels) < 10:
+        print(f"Only {len(labels)} labelled hands found, play a few more rounds first.")
+        return
+    train_x, train_y, val_x, val_y = split_data(landmarks, labels, args.validation)
+
+    model = LearnedGestureClassifier()
+    losses = model.fit(train_x, train_y, hidden=args.hidden, epochs=args.epochs, learning_rate=args.learning_rate)
+    model.save(args.out)
+
+    counts = ", ".join(f"{GESTURE_LABELS[code]}: {int(np.sum(labels == code))}" for code in range(NUM_CLASSES))
+    print(f"Hands: {len(labels)} ({counts}), final loss {losses[-1]:.4f}")
+    print(f"Train accuracy {np.mean(model.predict(train_x) == train_y):.3f}")
+    if len(val_y):
+        print(f"Validation accuracy {np.mean(model.predict(val_x) == val_y):.3f}")
+    print(f"Saved {args.out} ({os.path.getsize(args.out)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import numpy as np
+
+from src.gestures import UNKNOWN, gesture_name
+from src.hand_detector import HandDetector
+from src.landmarks import LandmarkBuffer, classify_landmarks_array
+
+
+# Outcome of voting over a window of frames
+class GestureVote(NamedTuple):
+    gesture: str  # winning gesture or "Unknown"
+    confidence: float  # winner's summed weight per frame looked at, frames without a classified hand count as 0, 0 to 1
+    frames: int  # frames that were looked at
+    hands_found: int  # frames where a hand was classified
+    tallies: Dict[str, float]  # summed weight per gesture
+
+
+# Single frame observation kept in the voting window
+class Observation(NamedTuple):
+    gesture: str
+    weight: float
+    timestamp: float
+    frame: np.ndarray
+    hand_landmarks: object  # Mediapipe landmark list, used for drawing
+    landmarks: Optional[np.ndarray]  # (21, 3) float32 landmarks
+
+
+def vote_gestures(observations: Iterable[Observation]) -> GestureVote:
+    """
+    Confidence weighted majority over a set of observations.
+
+    :param observations: Per frame observations, "Unknown" ones only count towards the frame total.
+    :return: The winning gesture and how sure the vote is.
+    """
+    tallies: Dict[str, float] = {}
+    frames = 0
+    hands_found = 0
+    for observation in observations:
+        frames += 1
+        if observation.gesture == "Unknown":
+            continue
+        hands_found += 1
+        tallies[observation.gesture] = tallies.get(observation.gesture, 0.0) + observation.weight
+
+    if not tallies:
+        return GestureVote("Unknown", 0.0, frames, hands_found, tallies)
+
+    gesture = max(tallies, key=tallies.get)
+    return GestureVote(gesture, tallies[gesture] / frames, frames, hands_found, tallies)
+
+
+# Runs hand tracking over consecutive frames and votes on the gesture
+class TemporalGestureVoter:
+    def __init__(self, detector: HandDetector, window: int = 8, classify=classify_landmarks_array):
+        """
+        :param detector: Detector in video mode, so Mediapipe tracks landmarks between detections.
+        :param window: Number of most recent frames that take part in the vote.
+        :param classify: Function mapping (N, 21, 3) landmarks to N gesture codes.
+        """
+        self.detector = detector
+        self.window = window
+        self.classify = classify
+        self.buffer = LandmarkBuffer()
+        # Last classified result, a detector with a cache returns the same object for unchanged frames
+        self.last_result = None
+        self.last_codes = None
+        self.observations: deque = deque(maxlen=window)
+        # Kept frames live in a preallocated pool with one spare slot, so observing never allocates
+        self.frame_pool = None
+        self.pool_index = 0
+        self.lock = threading.Lock()
+        # observe uses the detector, the landmark buffer and the frame pool, only one thread may run it at a time
+        self.observe_lock = threading.Lock()
+        self.watching = False
+        self.thread = None
+
+    def reset(self):
+        """Forget all observations"""
+        with self.lock:
+            self.observations.clear()
+
+    def _keep(self, frame: np.ndarray) -> np.ndarray:
+        """Copy a frame into the pool so it outlives the camera ring buffer slot it came from"""
+        if self.frame_pool is None or self.frame_pool.shape[1:] != frame.shape:
+            self.frame_pool = np.empty((self.window + 1,) + frame.shape, dtype=np.uint8)
+        slot = self.frame_pool[self.pool_index]
+        self.pool_index = (self.pool_index + 1) % len(self.frame_pool)
+        np.copyto(slot, frame)
+        return slot
+
+    def observe(self, frame: np.ndarray, timestamp: float = 0.0) -> Observation:
+        """
+        Track the hand in one RGB frame and add the result to the window.
+        Frames must be fed in capture order for tracking to kick in.
+        """
+        with self.observe_lock:
+            return self._observe(frame, timestamp)
+
+    def _observe(self, frame: np.ndarray, timestamp: float, is_current: Optional[Callable[[], bool]] = None) -> Optional[Observation]:
+        """
+        :param is_current: Checked once the frame has been copied, a frame viewed in place in the camera ring buffer
+                           may have been overwritten while inference ran. The observation is dropped if it returns False.
+        """
+        result = self.detector.process(frame)
+        frame = self._keep(frame)
+        if is_current is not None and not is_current():
+            # Give the slot back, it holds a torn copy that must not push a frame still in the window out of the pool
+            self.pool_index = (self.pool_index - 1) % len(self.frame_pool)
+            return None
+        observation = Observation("Unknown", 0.0, timestamp, frame, None, None)
+
+        if result.multi_hand_landmarks:
+            if result is self.last_result:
+                # Cache hit, the landmarks and gestures are still in the buffer
+                landmarks, codes = self.buffer.array[:len(self.last_codes)], self.last_codes
+            else:
+                # Classify every hand in the frame in one vectorized call
+                landmarks = self.buffer.from_result(result)
+                codes = self.classify(landmarks)
+                self.last_result, self.last_codes = result, codes
+            for index, code in enumerate(codes):
+                weight = 1.0
+                if result.multi_handedness and index < len(result.multi_handedness):
+                    weight = result.multi_handedness[index].classification[0].score
+
+                # Keep the most confident classified hand in the frame
+                if code != UNKNOWN and weight > observation.weight:
+                    observation = Observation(
+                        gesture_name(code), weight, timestamp, frame,
+                        result.multi_hand_landmarks[index], landmarks[index].copy()
+                    )
+
+        with self.lock:
+            self.observations.append(observation)
+        return observation
+
+    def vote(self) -> GestureVote:
+        """Vote over the frames currently in the window"""
+        with self.lock:
+            return vote_gestures(list(self.observations))
+
+    def best_observation(self, gesture: str) -> Optional[Observation]:
+        """Most confident observation of a gesture in the window, or the newest frame if there is none"""
+        with self.lock:
+            matches = [observation for observation in self.observations if observation.gesture == gesture]
+            if matches:
+                return max(matches, key=lambda observation: observation.weight)
+            return self.observations[-1] if self.observations else None
+
+    def classify_frames(self, frames: List[Tuple[np.ndarray, float]]) -> GestureVote:
+        """
+        Reset the window and vote over the given frames.
+
+        :param frames: (frame, timestamp) pairs in capture order, e.g. from CameraCapture.recent.
+        :return: The vote over those frames.
+        """
+        self.reset()
+        for frame, timestamp in frames[-self.window:]:
+            self.observe(frame, timestamp)
+        return self.vote()
+
+    def watch(self, capture):
+        """
+        Start feeding every new frame of a CameraCapture into the window on a background thread,
+        so the vote is ready the moment the countdown ends.
+        """
+        self.finish()
+        self.reset()
+        self.watching = True
+        self.thread = threading.Thread(target=self._watch, args=(capture,), name="gesture-voter")
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _watch(self, capture):
+        seen = capture.buffer.count
+        while self.watching:
+            if not capture.buffer.wait(seen, 0.1):
+                continue
+            # Run inference straight on the ring buffer slot, it is only copied once inference is done,
+            # then make sure the camera did not write over the slot in the meantime
+            frame, timestamp, seen = capture.buffer.latest_view()
+            if frame is None:
+                continue
+            with self.observe_lock:
+                # finish may have returned while this thread waited for the lock
+                if not self.watching:
+                    break
+                self._observe(frame, timestamp, lambda: capture.buffer.is_current(seen))
+
+    def finish(self) -> GestureVote:
+        """Stop watching and return the vote over the last window of frames"""
+        self.watching = False
+        if self.thread is not None:
+            # Wait out an observation in progress, e.g. the first Mediapipe run, so it never overlaps the caller's
+            self.thread.join()
+            self.thread = None
+        return self.vote()
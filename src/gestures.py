@@ -0,0 +1,75 @@
+from enum import IntEnum
+
+# Gesture labels shared by the classifiers and the logs, the index is the gesture code
+GESTURE_LABELS = ("Rock", "Paper", "Scissors", "Unknown")
+
+ROCK, PAPER, SCISSORS, UNKNOWN = range(len(GESTURE_LABELS))
+
+_CODES = {label.lower(): code for code, label in enumerate(GESTURE_LABELS)}
+
+
+def gesture_code(gesture: str) -> int:
+    """
+    Map a gesture name (any case) to its code.
+
+    :param gesture: Gesture name such as "Rock" or "rock".
+    :return: The gesture code, UNKNOWN for anything that is not a gesture.
+    """
+    return _CODES.get(str(gesture).lower(), UNKNOWN)
+
+
+def gesture_name(code: int) -> str:
+    """
+    Map a gesture code back to its name.
+
+    :param code: Gesture code.
+    :return: The gesture name, "Unknown" for codes out of range.
+    """
+    code = int(code)
+    return GESTURE_LABELS[code] if 0 <= code < len(GESTURE_LABELS) else GESTURE_LABELS[UNKNOWN]
+
+
+# The three playable moves, valued like their gesture codes so classifier output needs no translation
+class Move(IntEnum):
+    ROCK = ROCK
+    PAPER = PAPER
+    SCISSORS = SCISSORS
+
+    @property
+    def key(self) -> str:
+        """Lowercase name, used on the wire, in logs and for sprite names"""
+        return GESTURE_LABELS[self].lower()
+
+    @property
+    def label(self) -> str:
+        return GESTURE_LABELS[self]
+
+    def beats(self, other: "Move") -> bool:
+        """Each move beats the one before it in Rock, Paper, Scissors order"""
+        return (self - other) % 3 == 1
+
+    @classmethod
+    def parse(cls, value) -> "Move":
+        """
+        Validate a move coming from outside the game, e.g. a classifier, an LLM response or the network.
+
+        :param value: A Move, a gesture code or a move name in any case.
+        :return: The move.
+        :raises ValueError: For anything that is not one of the three moves.
+        """
+        if isinstance(value, Move):
+            return value
+        code = None
+        if isinstance(value, str):
+            code = _CODES.get(value.strip().lower())
+        elif isinstance(value, int) and not isinstance(value, bool):
+            code = value
+        elif hasattr(value, "dtype") and getattr(value, "ndim", 1) == 0 and value.dtype.kind in "iu":
+            code = int(value)  # NumPy integer scalars from the classifiers
+        if code in (ROCK, PAPER, SCISSORS):
+            return cls(code)
+        raise ValueError(f"Invalid move: {value!r}")
+
+
+# Moves in code order, MOVES[code] is the move for a gesture code
+MOVES = tuple(Move)
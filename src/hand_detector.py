@@ -0,0 +1,193 @@
+import time
+import threading
+import cv2
+import numpy as np
+import mediapipe as mp
+from typing import Dict, Optional
+
+from src.detection_cache import DetectionCache
+from src.landmarks import LandmarkBuffer
+from src.roi_tracker import RoiTracker
+
+# Mediapipe Hands solution
+mp_hands = mp.solutions.hands
+
+# Default settings used by every game mode
+DEFAULT_HANDS_CONFIG = {
+    "static_image_mode": False,
+    "max_num_hands": 2,
+    "model_complexity": 1,
+    "min_detection_confidence": 0.7,
+    "min_tracking_confidence": 0.7,
+}
+
+
+# Long lived hand detector so the Mediapipe graph is built once instead of every round
+class HandDetector:
+    def __init__(self, inference_width: Optional[int] = None, roi_tracker: Optional[RoiTracker] = None, roi_patch_size: int = 256,
+                 cache: Optional[DetectionCache] = None, **config):
+        """
+        Create the Mediapipe Hands graph once and keep it for the whole session.
+
+        :param inference_width: Downscale frames wider than this before inference, None keeps the camera resolution.
+                                Lower values trade accuracy for speed on slow CPUs.
+        :param roi_tracker: Run inference on a patch around the last known hand instead of the full frame.
+        :param roi_patch_size: Downscale region of interest patches larger than this.
+        :param cache: Reuse the previous result for frames that look the same as the last processed one.
+        :param config: Any of the keyword arguments accepted by mp.solutions.hands.Hands.
+        """
+        self.config: Dict = dict(DEFAULT_HANDS_CONFIG)
+        self.config.update(config)
+        self.inference_width = inference_width
+        self.roi_tracker = roi_tracker
+        self.roi_patch_size = roi_patch_size
+        self.cache = cache
+        self.buffer = LandmarkBuffer()
+        self.hands = None
+        self.lock = threading.Lock()
+        self.warm = False
+        self._open()
+
+    def _open(self):
+        """Build the Mediapipe graph with the current config"""
+        self.hands = mp_hands.Hands(**self.config)
+        self.warm = False
+
+    def warm_up(self, width: int = 640, height: int = 480) -> float:
+        """
+        Push a blank frame through the graph so the first real round does not pay for model loading.
+
+        :param width: Width of the warm-up frame.
+        :param height: Height of the warm-up frame.
+        :return: The time the warm-up took in seconds.
+        """
+        blank = np.zeros((height, width, 3), dtype=np.uint8)
+        start = time.perf_counter()
+        self.process(blank)
+        self.warm = True
+        if self.cache is not None:
+            self.cache.invalidate()  # never serve the blank frame's empty result
+        return time.perf_counter() - start
+
+    def _downscale(self, frame: np.ndarray, limit: Optional[int]) -> np.ndarray:
+        """Shrink a frame so its width is at most limit, landmarks are normalized so they need no correction"""
+        height, width = frame.shape[:2]
+        if limit is None or width <= limit:
+            return np.ascontiguousarray(frame)
+        return cv2.resize(frame, (limit, max(1, round(height * limit / width))), interpolation=cv2.INTER_AREA)
+
+    def process(self, frame: np.ndarray):
+        """
+        Run the hand landmark graph on a single RGB frame and return the Mediapipe result.
+        Landmarks are always normalized to the full frame, also when only a patch was processed.
+        With a cache, a frame that matches the last processed one returns the very same result object.
+        """
+        with self.lock:
+            if self.hands is None:
+                raise RuntimeError("HandDetector has been closed.")
+
+            if self.cache is not None:
+                cached = self.cache.lookup(frame)
+                if cached is not None:
+                    return cached
+
+            result = self._infer(frame)
+            if self.cache is not None:
+                self.cache.store(result)
+            return result
+
+    def _infer(self, frame: np.ndarray):
+        if self.roi_tracker is None:
+            return self.hands.process(self._downscale(frame, self.inference_width))
+
+        patch, region = self.roi_tracker.crop(frame)
+        limit = self.inference_width if region is None else self.roi_patch_size
+        result = self.hands.process(self._downscale(patch, limit))
+        self.roi_tracker.remap_result(result, region, frame.shape)
+
+        landmarks = self.buffer.from_result(result) if result.multi_hand_landmarks else None
+        self.roi_tracker.update(landmarks, frame.shape)
+        return result
+
+    def reconfigure(self, **config) -> bool:
+        """
+        Change the detector settings, e.g. the confidence thresholds.
+        The graph is only rebuilt when a value actually changes.
+
+        :param config: inference_width or any of the keyword arguments accepted by mp.solutions.hands.Hands.
+        :return: True if the graph was rebuilt.
+        """
+        inference_width = config.pop("inference_width", self.inference_width)
+
+        unknown = set(config) - set(DEFAULT_HANDS_CONFIG)
+        if unknown:
+            raise ValueError(f"Unknown hand detector options: {', '.join(sorted(unknown))}")
+
+        changed = {key: value for key, value in config.items() if self.config.get(key) != value}
+        with self.lock:
+            # process reads the width under the lock, never change it halfway through a frame
+            self.inference_width = inference_width
+            if not changed:
+                return False
+
+            if self.hands is not None:
+                self.hands.close()
+            self.config.update(changed)
+            self._open()
+            if self.roi_tracker is not None:
+                self.roi_tracker.reset()
+            if self.cache is not None:
+                self.cache.invalidate()
+        return True
+
+    def close(self):
+        """Release the Mediapipe graph"""
+        with self.lock:
+            if self.hands is not None:
+                self.hands.close()
+                self.hands = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+# Shared detector for the running game
+_shared_detector: Optional[HandDetector] = None
+
+
+def get_hand_detector(warm_up: bool = True, track_roi: bool = False, cache_frames: bool = False, **config) -> HandDetector:
+    """
+    Return the process wide hand detector, creating it on first use.
+
+    :param warm_up: Run a blank frame through the graph when it is created.
+    :param track_roi: Make sure the detector has a RoiTracker, an existing detector without one gets one attached.
+    :param cache_frames: Make sure the detector has a DetectionCache, an existing detector without one gets one attached.
+    :param config: Settings applied to the detector, rebuilding it if they differ.
+    :return: The shared HandDetector.
+    """
+    global _shared_detector
+    if _shared_detector is None or _shared_detector.hands is None:
+        _shared_detector = HandDetector(roi_tracker=RoiTracker() if track_roi else None,
+                                        cache=DetectionCache() if cache_frames else None, **config)
+        if warm_up:
+            _shared_detector.warm_up()
+    else:
+        if config:
+            _shared_detector.reconfigure(**config)
+        with _shared_detector.lock:
+            if track_roi and _shared_detector.roi_tracker is None:
+                _shared_detector.roi_tracker = RoiTracker()
+            if cache_frames and _shared_detector.cache is None:
+                _shared_detector.cache = DetectionCache()
+    return _shared_detector
+
+
+def close_hand_detector():
+    """Shut down the shared hand detector if it was created"""
+    global _shared_detector
+    if _shared_detector is not None:
+        _shared_detector.close()
+        _shared_detector = None
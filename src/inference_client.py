@@ -0,0 +1,117 @@
+import os
+import time
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Endpoint of the hosted models. INFERENCE_ENDPOINT points the AI modes elsewhere, e.g. at src/inference_stub.py
+DEFAULT_ENDPOINT = "https://models.inference.ai.azure.com"
+
+
+def inference_endpoint() -> str:
+    return os.environ.get("INFERENCE_ENDPOINT") or DEFAULT_ENDPOINT
+
+
+# Long-lived inference clients shared by every AI side. A client keeps its HTTP session, and with it the
+# keep-alive connections of its pool, for as long as the game runs, so only the first move pays for the
+# TCP and TLS handshakes. Clients are keyed by endpoint and key, two AIs with the same key share one client
+class InferenceClientManager:
+    def __init__(self, connection_timeout: float = 10.0, read_timeout: float = 60.0):
+        """
+        :param connection_timeout: Seconds to wait for a new connection.
+        :param read_timeout: Seconds to wait for a response.
+        """
+        self.connection_timeout = connection_timeout
+        self.read_timeout = read_timeout
+        self.lock = threading.Lock()
+        self.clients: Dict[Tuple[str, str], object] = {}
+        # Clients that finished a request, the next requests reuse its open connection
+        self.warm = set()
+
+        # Seconds spent building clients, on requests that had to connect first and on requests over open connections
+        self.setup_times: List[float] = []
+        self.cold_request_times: List[float] = []
+        self.warm_request_times: List[float] = []
+
+    def client(self, api_key: str, endpoint: Optional[str] = None):
+        """
+        Return the client for an endpoint and key, building it on first use.
+
+        :param api_key: Token for the endpoint.
+        :param endpoint: Endpoint URL, inference_endpoint() by default.
+        :return: The (endpoint, key) pair identifying the client and the ChatCompletionsClient.
+        """
+        from src.utils import load_inference_sdk
+
+        key = (endpoint or inference_endpoint(), api_key)
+        with self.lock:
+            client = self.clients.get(key)
+            if client is None:
+                ChatCompletionsClient, _, AzureKeyCredential = load_inference_sdk()
+                start = time.perf_counter()
+                client = ChatCompletionsClient(
+                    endpoint=key[0],
+                    credential=AzureKeyCredential(api_key),
+                    connection_timeout=self.connection_timeout,
+                    read_timeout=self.read_timeout,
+                )
+                self.setup_times.append(time.perf_counter() - start)
+                self.clients[key] = client
+        return key, client
+
+    def complete(self, api_key: str, endpoint: Optional[str] = None, **kwargs):
+        """
+        Send a chat completion request through the shared client.
+
+        :param api_key: Token for the endpoint.
+        :param endpoint: Endpoint URL, inference_endpoint() by default.
+        :param kwargs: Arguments of ChatCompletionsClient.complete.
+        :return: The response.
+        """
+        key, client = self.client(api_key, endpoint)
+        cold = key not in self.warm
+        start = time.perf_counter()
+        response = client.complete(**kwargs)
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            (self.cold_request_times if cold else self.warm_request_times).append(elapsed)
+            self.warm.add(key)
+        return response
+
+    def stats(self) -> Dict[str, float]:
+        """Client count and mean milliseconds of client setup, connecting requests and requests on open connections"""
+        def mean_ms(times: List[float]) -> float:
+            return sum(times) / len(times) * 1000 if times else 0.0
+
+        with self.lock:
+            return {
+                "clients": len(self.clients),
+                "requests": len(self.cold_request_times) + len(self.warm_request_times),
+                "setup_ms": mean_ms(self.setup_times),
+                "cold_request_ms": mean_ms(self.cold_request_times),
+                "warm_request_ms": mean_ms(self.warm_request_times),
+            }
+
+    def close(self):
+        """Close every client and its connections"""
+        with self.lock:
+            clients, self.clients = list(self.clients.values()), {}
+            self.warm.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logging.warning(f"Could not close inference client: {str(e)}")
+
+
+_manager: Optional[InferenceClientManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_client_manager() -> InferenceClientManager:
+    """The manager shared by both AI modes"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = InferenceClientManager()
+        return _manager
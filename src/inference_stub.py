@@ -0,0 +1,133 @@
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+# Answers chat completion requests like the hosted endpoint, with a play_rock_paper_scissors tool call.
+# Keep-alive is on, so the counters show how many connections the clients opened for their requests
+class StubInferenceServer:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, connect_delay: float = 0.0,
+                 choice: Optional[str] = None):
+        """
+        :param host: Address to listen on.
+        :param port: Port, 0 picks a free one.
+        :param latency: Seconds every request takes.
+        :param connect_delay: Seconds added to the first request of every connection, stands in for the TLS handshake.
+        :param choice: Move every response plays, a random one by default.
+        """
+        self.latency = latency
+        self.connect_delay = connect_delay
+        self.choice = choice
+        self.connections = 0
+        self.requests = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes, without this delayed ACKs stall every keep-alive response
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with stub.lock:
+                    stub.connections += 1
+                self.fresh = True
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with stub.lock:
+                    stub.requests += 1
+                time.sleep(stub.latency + (stub.connect_delay if self.fresh else 0.0))
+                self.fresh = False
+
+                try:
+                    model = json.loads(body).get("model", "stub")
+                except ValueError:
+                    model = "stub"
+                arguments = {"Choice": stub.choice or random.choice(["Rock", "Paper", "Scissors"]), "Reason": "Stub response."}
+                payload = json.dumps({
+                    "id": f"stub-{stub.requests}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "finish_reason": "tool_calls",
+                        "message": {
+                            "role": "assistant",
+                            "content": None,
+                            "tool_calls": [{
+                                "id": "call_0",
+                                "type": "function",
+                                "function": {"name": "play_rock_paper_scissors", "arguments": json.dumps(arguments)},
+                            }],
+                        },
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                }).encode()
+
+                try:
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client timed out and hung up
+                    self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "StubInferenceServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name="inference-stub", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "StubInferenceServer":
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve canned Rock Paper Scissors moves in place of the inference endpoint.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.2, help="Seconds every request takes.")
+    parser.add_argument("--connect-delay", type=float, default=0.0, help="Extra seconds for the first request of a connection.")
+    args = parser.parse_args()
+
+    stub = StubInferenceServer(port=args.port, latency=args.latency, connect_delay=args.connect_delay)
+    print(f"Set INFERENCE_ENDPOINT={stub.url} to play against the stub")
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
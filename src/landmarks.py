@@ -0,0 +1,106 @@
+import numpy as np
+from typing import Optional
+
+from src.gestures import ROCK, PAPER, SCISSORS, UNKNOWN
+
+NUM_LANDMARKS = 21
+
+# Finger tips and the joint below them for the index, middle, ring and pinky fingers
+FINGER_TIPS = np.array([8, 12, 16, 20])
+FINGER_JOINTS = np.array([7, 11, 15, 19])
+
+
+def as_landmark_array(landmarks) -> np.ndarray:
+    """
+    View landmarks as a float32 (N, 21, 3) array, copying only when the input is not one already.
+
+    :param landmarks: A (21, 3) or (N, 21, 3) array, or a list of (x, y, z) tuples for one hand.
+    :return: A (N, 21, 3) float32 array.
+    """
+    array = np.asarray(landmarks, dtype=np.float32)
+    if array.ndim == 2:
+        array = array[np.newaxis]
+    if array.shape[1:] != (NUM_LANDMARKS, 3):
+        raise ValueError(f"Expected landmarks of shape (N, {NUM_LANDMARKS}, 3), got {array.shape}")
+    return array
+
+
+# Vectorized version of utils.normalize_landmarks
+def normalize_landmarks_array(landmarks, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Translate every hand so its wrist (landmark 0) is the origin in x and y.
+
+    :param landmarks: (N, 21, 3) or (21, 3) landmarks.
+    :param out: Optional (N, 21, 3) float32 array to write into instead of allocating.
+    :return: The normalized (N, 21, 3) landmarks.
+    """
+    landmarks = as_landmark_array(landmarks)
+    if out is None:
+        out = np.empty_like(landmarks)
+    out[:, :, :2] = landmarks[:, :, :2] - landmarks[:, :1, :2]
+    out[:, :, 2] = landmarks[:, :, 2]
+    return out
+
+
+# Vectorized version of utils.classify_hand_landmarks
+def classify_landmarks_array(landmarks) -> np.ndarray:
+    """
+    Classify many hands or frames in one call with the same finger rules as classify_hand_landmarks.
+
+    :param landmarks: (N, 21, 3) or (21, 3) landmarks.
+    :return: (N,) int8 gesture codes from src.gestures.
+    """
+    landmarks = as_landmark_array(landmarks)
+
+    # A finger is up when its tip is above the joint below it, translation by the wrist cancels out
+    y = landmarks[:, :, 1]
+    fingers_up = y[:, FINGER_TIPS] < y[:, FINGER_JOINTS]
+
+    codes = np.full(len(landmarks), UNKNOWN, dtype=np.int8)
+    codes[fingers_up.all(axis=1)] = PAPER
+    codes[fingers_up[:, 0] & fingers_up[:, 1] & ~fingers_up[:, 2] & ~fingers_up[:, 3]] = SCISSORS
+    codes[~fingers_up.any(axis=1)] = ROCK
+    return codes
+
+
+# Copies Mediapipe landmark protobufs straight into a reused array
+class LandmarkBuffer:
+    def __init__(self, max_hands: int = 2):
+        """
+        :param max_hands: Largest number of hands a single result can hold.
+        """
+        self.array = np.zeros((max_hands, NUM_LANDMARKS, 3), dtype=np.float32)
+
+    def from_hand(self, hand_landmarks, index: int = 0) -> np.ndarray:
+        """Fill slot index from one NormalizedLandmarkList and return a (21, 3) view of it"""
+        self.array[index].reshape(-1)[:] = np.fromiter(
+            (value for lm in hand_landmarks.landmark for value in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=NUM_LANDMARKS * 3,
+        )
+        return self.array[index]
+
+    def from_result(self, result) -> np.ndarray:
+        """
+        Convert every hand in a Mediapipe Hands result without building tuples per landmark.
+
+        :param result: The value returned by Hands.process.
+        :return: A (hands, 21, 3) view into the buffer, valid until the next call.
+        """
+        hands = result.multi_hand_landmarks or []
+        if len(hands) > len(self.array):
+            self.array = np.zeros((len(hands), NUM_LANDMARKS, 3), dtype=np.float32)
+        for index, hand_landmarks in enumerate(hands):
+            self.from_hand(hand_landmarks, index)
+        return self.array[:len(hands)]
+
+
+def landmarks_from_mediapipe(result) -> np.ndarray:
+    """
+    Convert a Mediapipe Hands result to a new (hands, 21, 3) float32 array.
+
+    :param result: The value returned by Hands.process.
+    :return: The landmarks of every detected hand.
+    """
+    hands = result.multi_hand_landmarks or []
+    return LandmarkBuffer(max(1, len(hands))).from_result(result)
@@ -1,5 +1,8 @@
 import os
 import sys
+import time
+import argparse
+import threading
 import cv2
 import mediapipe as mp
 
@@ -9,15 +12,26 @@ sys.path.append(root_dir)
 
 # Now you can import from src
 from src.utils import classify_hand_landmarks
+from src.detection_cache import DetectionCache
+from src.frame_adapter import FrameAdapter
+from src.gesture_model import load_game_classifier
+from src.gestures import gesture_name
+from src.hand_detector import HandDetector
+from src.landmarks import LandmarkBuffer
+from src.pipeline import DropOldestQueue, StageTimer
 
+mp_hands = mp.solutions.hands
+mp_drawing = mp.solutions.drawing_utils
 
-# Main function to capture camera feed and classify hand gestures
-def main():
-    mp_hands = mp.solutions.hands
+# Stages shown in the overlay, in pipeline order
+OVERLAY_STAGES = ("capture", "inference", "classify", "display", "end_to_end")
+
+
+# Original single loop, every stage waits for the one before it
+def run_sequential(camera_index: int):
     hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
-    mp_drawing = mp.solutions.drawing_utils
 
-    cap = cv2.VideoCapture(0)
+    cap = cv2.VideoCapture(camera_index)
 
     if not cap.isOpened():
         print("Error: Could not open camera.")
@@ -75,5 +89,136 @@ def main():
         cap.release()
         cv2.destroyAllWindows()
 
+
+# Capture stage, reads the camera as fast as it delivers and never waits for inference
+def capture_stage(cap, frames: DropOldestQueue, timer: StageTimer, stop: threading.Event):
+    try:
+        while not stop.is_set():
+            start = time.perf_counter()
+            ret, frame = cap.read()
+            if not ret:
+                print("Error: Could not read frame.")
+                break
+
+            # Flip the frame horizontally for a mirror view
+            frame = cv2.flip(frame, 1)
+            timer.record("capture", time.perf_counter() - start)
+            frames.put((frame, start))
+    finally:
+        frames.close()
+
+
+# Inference stage, always works on the newest frame and skips the ones it could not keep up with
+def inference_stage(frames: DropOldestQueue, results: DropOldestQueue, timer: StageTimer, cache: DetectionCache):
+    detector = HandDetector(cache=cache, min_detection_confidence=0.7, min_tracking_confidence=0.7)
+    classifier = load_game_classifier()
+    adapter = FrameAdapter()
+    buffer = LandmarkBuffer()
+
+    try:
+        while True:
+            item = frames.get(timeout=0.5)
+            if item is None:
+                if frames.closed:
+                    break
+                continue
+            frame, captured_at = item
+
+            start = time.perf_counter()
+            result = detector.process(adapter.from_bgr(frame))
+            timer.record("inference", time.perf_counter() - start)
+
+            start = time.perf_counter()
+            gestures = []
+            if result.multi_hand_landmarks:
+                gestures = [gesture_name(code) for code in classifier(buffer.from_result(result))]
+            timer.record("classify", time.perf_counter() - start)
+
+            results.put((frame, result.multi_hand_landmarks, gestures, captured_at))
+    finally:
+        detector.close()
+        results.close()
+
+
+def draw_overlay(frame, timer: StageTimer, frames: DropOldestQueue, results: DropOldestQueue, cache: DetectionCache):
+    """Write the frame rates, the average latency of every stage, the dropped frames and the cache hit rate on the frame"""
+    lines = [f"FPS: {timer.rate('display'):.1f} (camera {timer.rate('capture'):.1f})"]
+    lines += [f"{stage}: {timer.latency_ms(stage):.1f} ms" for stage in OVERLAY_STAGES if stage in timer.stages()]
+    lines.append(f"dropped: {frames.dropped} capture / {results.dropped} results")
+    lines.append(f"cache hits: {cache.stats()['hit_rate']:.0%}")
+
+    for i, line in enumerate(lines):
+        cv2.putText(frame, line, (10, frame.shape[0] - 20 - 22 * (len(lines) - 1 - i)),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.55, (255, 255, 0), 1, cv2.LINE_AA)
+
+
+# Capture, inference and display run concurrently, joined by small drop-oldest queues
+def run_pipelined(camera_index: int, queue_size: int):
+    cap = cv2.VideoCapture(camera_index)
+
+    if not cap.isOpened():
+        print("Error: Could not open camera.")
+        return
+
+    frames = DropOldestQueue(queue_size)
+    results = DropOldestQueue(queue_size)
+    timer = StageTimer()
+    cache = DetectionCache()
+    stop = threading.Event()
+
+    threads = [
+        threading.Thread(target=capture_stage, args=(cap, frames, timer, stop), name="capture", daemon=True),
+        threading.Thread(target=inference_stage, args=(frames, results, timer, cache), name="inference", daemon=True),
+    ]
+    for thread in threads:
+        thread.start()
+
+    # cv2.imshow has to stay on the main thread, so the display stage runs here
+    try:
+        while True:
+            item = results.get(timeout=0.5)
+            if item is None:
+                if results.closed:
+                    break
+                continue
+            frame, multi_hand_landmarks, gestures, captured_at = item
+
+            start = time.perf_counter()
+            for hand_landmarks in multi_hand_landmarks or []:
+                mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+            for gesture in gestures:
+                cv2.putText(frame, f"Gesture: {gesture}", (10, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2, cv2.LINE_AA)
+            draw_overlay(frame, timer, frames, results, cache)
+
+            cv2.imshow("Rock Paper Scissors", frame)
+            key = cv2.waitKey(1) & 0xFF
+            timer.record("display", time.perf_counter() - start)
+            timer.record("end_to_end", time.perf_counter() - captured_at)
+
+            # Break the loop if 'q' is pressed
+            if key == ord('q'):
+                break
+
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join(timeout=2)
+        cap.release()
+        cv2.destroyAllWindows()
+
+
+# Main function to capture camera feed and classify hand gestures
+def main():
+    parser = argparse.ArgumentParser(description="Classify hand gestures from the camera feed.")
+    parser.add_argument("--camera", type=int, default=0, help="Camera device index")
+    parser.add_argument("--sequential", action="store_true", help="Run every stage in a single loop like before")
+    parser.add_argument("--queue-size", type=int, default=2, help="Frames kept between stages before the oldest is dropped")
+    args = parser.parse_args()
+
+    if args.sequential:
+        run_sequential(args.camera)
+    else:
+        run_pipelined(args.camera, args.queue_size)
+
 if __name__ == "__main__":
     main()
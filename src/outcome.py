@@ -0,0 +1,132 @@
+from typing import Dict, Optional, Sequence, Tuple
+
+from src.gestures import Move, MOVES
+
+# NumPy is only imported by the batch functions, so the game and the server start without it
+
+# Outcome codes, the payoff of a round for the first player
+WIN, DRAW, LOSS = 1, 0, -1
+
+# PAYOFF[move][other_move] is the outcome for the player who played move, rows and columns in Move order
+PAYOFF = (
+    #  rock paper scissors
+    (DRAW, LOSS, WIN),  # rock
+    (WIN, DRAW, LOSS),  # paper
+    (LOSS, WIN, DRAW),  # scissors
+)
+
+# Outcome names used by the game and the logs, and the score counter each outcome adds to
+OUTCOME_NAMES = {WIN: "win", DRAW: "draw", LOSS: "loss"}
+SCORE_KEY = {"win": "wins", "loss": "losses", "draw": "draws"}
+
+# The opposite outcome, as seen from the other side
+OPPOSITE = {"win": "loss", "loss": "win", "draw": "draw"}
+
+
+def empty_scores() -> Dict[str, int]:
+    return {"wins": 0, "losses": 0, "draws": 0}
+
+
+def resolve(move: Move, other_move: Move) -> int:
+    """
+    Decide one round from the first player's point of view.
+
+    :param move: The first player's move.
+    :param other_move: The other player's move.
+    :return: WIN, DRAW or LOSS.
+    """
+    return PAYOFF[move][other_move]
+
+
+def determine_outcome(move: Move, other_move: Move) -> str:
+    """
+    Decide one round from the first player's point of view.
+
+    :param move: The first player's move.
+    :param other_move: The other player's move.
+    :return: "win", "loss" or "draw".
+    """
+    return OUTCOME_NAMES[PAYOFF[move][other_move]]
+
+
+def add_outcome(scores: Dict[str, int], other_scores: Dict[str, int], outcome: str):
+    """Count a round's outcome, given from the first side's point of view, in both sides' scores"""
+    scores[SCORE_KEY[outcome]] += 1
+    other_scores[SCORE_KEY[OPPOSITE[outcome]]] += 1
+
+
+def payoff_matrix():
+    """PAYOFF as a (3, 3) int8 array"""
+    import numpy as np
+    return np.array(PAYOFF, dtype=np.int8)
+
+
+def resolve_many(moves, other_moves):
+    """
+    Decide any number of rounds in one call.
+
+    :param moves: Array of the first player's moves as move values, any shape.
+    :param other_moves: Array of the other player's moves, broadcast against moves.
+    :return: int8 array of WIN, DRAW and LOSS.
+    :raises ValueError: If any value is not a move.
+    """
+    import numpy as np
+    moves = np.asarray(moves)
+    other_moves = np.asarray(other_moves)
+    for array in (moves, other_moves):
+        if array.dtype.kind not in "iu":
+            raise ValueError(f"Moves must be integer move values, got {array.dtype}.")
+        if array.size and (array.min() < 0 or array.max() >= len(MOVES)):
+            raise ValueError("Moves must be 0 (rock), 1 (paper) or 2 (scissors).")
+    return payoff_matrix()[moves, other_moves]
+
+
+def aggregate(payoffs) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """
+    Sum the outcomes of many rounds into both sides' scores.
+
+    :param payoffs: Array of WIN, DRAW and LOSS from the first player's point of view, e.g. from resolve_many.
+    :return: The first and the second player's scores.
+    """
+    import numpy as np
+    losses, draws, wins = np.bincount(np.asarray(payoffs, dtype=np.int64).ravel() + 1, minlength=3).tolist()
+    return {"wins": wins, "losses": losses, "draws": draws}, {"wins": losses, "losses": wins, "draws": draws}
+
+
+def simulate(strategy: Sequence[float], other_strategy: Sequence[float], rounds: int, seed: Optional[int] = None):
+    """
+    Play rounds between two fixed mixed strategies.
+
+    :param strategy: Probability of rock, paper and scissors for the first player.
+    :param other_strategy: The same for the other player.
+    :param rounds: Number of rounds.
+    :param seed: Random seed, for repeatable runs.
+    :return: Both players' scores, see aggregate.
+    """
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    moves = rng.choice(len(MOVES), size=rounds, p=strategy).astype(np.int8)
+    other_moves = rng.choice(len(MOVES), size=rounds, p=other_strategy).astype(np.int8)
+    return aggregate(resolve_many(moves, other_moves))
+
+
+def tournament(strategies: Dict[str, Sequence[float]], rounds: int, seed: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Play every pair of strategies against each other.
+
+    :param strategies: Mixed strategies by name, see simulate.
+    :param rounds: Rounds per pairing.
+    :param seed: Random seed, for repeatable runs.
+    :return: Total scores by strategy name.
+    """
+    import numpy as np
+    rng = np.random.default_rng(seed)
+    totals = {name: empty_scores() for name in strategies}
+    names = list(strategies)
+    for i, name in enumerate(names):
+        for other_name in names[i + 1:]:
+            scores, other_scores = simulate(strategies[name], strategies[other_name], rounds, seed=rng.integers(2 ** 32))
+            for key in scores:
+                totals[name][key] += scores[key]
+                totals[other_name][key] += other_scores[key]
+    return totals
@@ -0,0 +1,73 @@
+import time
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+
+# Bounded queue between pipeline stages that throws away the oldest item instead of blocking the producer
+class DropOldestQueue:
+    def __init__(self, maxsize: int = 2):
+        """
+        :param maxsize: Items kept, a slow consumer only ever sees the newest ones.
+        """
+        self.items: deque = deque(maxlen=maxsize)
+        self.condition = threading.Condition()
+        self.dropped = 0
+        self.closed = False
+
+    def put(self, item):
+        """Add an item, dropping the oldest one if the queue is full"""
+        with self.condition:
+            if len(self.items) == self.items.maxlen:
+                self.dropped += 1
+            self.items.append(item)
+            self.condition.notify()
+
+    def get(self, timeout: Optional[float] = None):
+        """Take the oldest item, or return None on timeout or once the queue is closed and empty"""
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.items or self.closed, timeout):
+                return None
+            return self.items.popleft() if self.items else None
+
+    def close(self):
+        """Wake up every consumer so the stages can shut down"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+
+# Rolling per stage latency and rate measurements, safe to update from several threads
+class StageTimer:
+    def __init__(self, window: int = 60):
+        """
+        :param window: Number of recent samples the averages are taken over.
+        """
+        self.window = window
+        self.latencies: Dict[str, deque] = {}
+        self.ticks: Dict[str, deque] = {}
+        self.lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float):
+        """Add one latency sample for a stage and count it towards the stage's rate"""
+        with self.lock:
+            self.latencies.setdefault(stage, deque(maxlen=self.window)).append(seconds)
+            self.ticks.setdefault(stage, deque(maxlen=self.window)).append(time.perf_counter())
+
+    def latency_ms(self, stage: str) -> float:
+        """Average latency of a stage in milliseconds"""
+        with self.lock:
+            samples = self.latencies.get(stage)
+            return sum(samples) / len(samples) * 1000 if samples else 0.0
+
+    def rate(self, stage: str) -> float:
+        """How many times per second a stage completed recently"""
+        with self.lock:
+            ticks = self.ticks.get(stage)
+            if not ticks or len(ticks) < 2 or ticks[-1] == ticks[0]:
+                return 0.0
+            return (len(ticks) - 1) / (ticks[-1] - ticks[0])
+
+    def stages(self):
+        with self.lock:
+            return list(self.latencies)
@@ -0,0 +1,105 @@
+import numpy as np
+from typing import Optional, Tuple
+
+# Region of a frame in pixels: x0, y0, x1, y1
+Region = Tuple[int, int, int, int]
+
+
+# Remembers where the hand was so inference can run on a small patch instead of the whole frame
+class RoiTracker:
+    def __init__(self, margin: float = 0.5, min_size: float = 0.3, slack: float = 0.1, lost_after: int = 2):
+        """
+        :param margin: Extra space around the hand box on every side, relative to the box size.
+        :param min_size: Smallest region side relative to the frame height.
+        :param slack: How close to the region edge, relative to its size, the hand may get before the region is moved.
+        :param lost_after: Frames without a hand before falling back to full frame search.
+        """
+        self.margin = margin
+        self.min_size = min_size
+        self.slack = slack
+        self.lost_after = lost_after
+        self.region: Optional[Region] = None
+        self.misses = 0
+        self.hits = 0
+        self.full_frame_searches = 0
+
+    def reset(self):
+        """Forget the hand, the next frame is searched in full"""
+        self.region = None
+        self.misses = 0
+
+    def crop(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[Region]]:
+        """
+        Cut the tracked region out of a frame.
+
+        :param frame: (height, width, 3) frame.
+        :return: The patch, a view into the frame, and its region, or the full frame and None when no hand is tracked.
+        """
+        if self.region is None:
+            self.full_frame_searches += 1
+            return frame, None
+        x0, y0, x1, y1 = self.region
+        return frame[y0:y1, x0:x1], self.region
+
+    def remap_result(self, result, region: Optional[Region], frame_shape):
+        """
+        Rewrite the landmarks of a Mediapipe result computed on a patch so they are normalized to the full frame.
+        z is scaled like x, matching how Mediapipe normalizes depth.
+        """
+        if region is None or not result.multi_hand_landmarks:
+            return result
+        height, width = frame_shape[:2]
+        x0, y0, x1, y1 = region
+        scale_x = (x1 - x0) / width
+        scale_y = (y1 - y0) / height
+        offset_x = x0 / width
+        offset_y = y0 / height
+        for hand_landmarks in result.multi_hand_landmarks:
+            for lm in hand_landmarks.landmark:
+                lm.x = lm.x * scale_x + offset_x
+                lm.y = lm.y * scale_y + offset_y
+                lm.z = lm.z * scale_x
+        return result
+
+    def update(self, landmarks: Optional[np.ndarray], frame_shape):
+        """
+        Move the region to follow the hand.
+
+        :param landmarks: (N, 21, 3) landmarks normalized to the full frame, or None if no hand was found.
+        :param frame_shape: Shape of the full frame.
+        """
+        if landmarks is None or len(landmarks) == 0:
+            self.misses += 1
+            if self.misses >= self.lost_after:
+                self.reset()
+            return
+
+        self.misses = 0
+        self.hits += 1
+        height, width = frame_shape[:2]
+        xs = landmarks[..., 0] * width
+        ys = landmarks[..., 1] * height
+        box = (xs.min(), ys.min(), xs.max(), ys.max())
+
+        # Keep the region still while the hand stays well inside it, Mediapipe's own tracking
+        # relies on the previous landmarks and breaks if the patch moves every frame
+        if self.region is not None and self._contains(self.region, box):
+            return
+        self.region = self._region_around(box, width, height)
+
+    def _contains(self, region: Region, box) -> bool:
+        x0, y0, x1, y1 = region
+        pad_x = (x1 - x0) * self.slack
+        pad_y = (y1 - y0) * self.slack
+        return box[0] >= x0 + pad_x and box[1] >= y0 + pad_y and box[2] <= x1 - pad_x and box[3] <= y1 - pad_y
+
+    def _region_around(self, box, width: int, height: int) -> Region:
+        """Square region around the box with the margin added, clamped to the frame"""
+        centre_x = (box[0] + box[2]) / 2
+        centre_y = (box[1] + box[3]) / 2
+        side = max(box[2] - box[0], box[3] - box[1]) * (1 + 2 * self.margin)
+        side = int(min(max(side, self.min_size * height), width, height))
+
+        x0 = int(np.clip(centre_x - side / 2, 0, width - side))
+        y0 = int(np.clip(centre_y - side / 2, 0, height - side))
+        return x0, y0, x0 + side, y0 + side
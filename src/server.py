@@ -1,8 +1,22 @@
+import os
+import sys
 import socket
 from _thread import *
 import json
 import time
-from utils import get_local_ip
+
+# Add the root directory to sys.path
+root_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(root_dir)
+
+# Now you can import from src
+from src.gestures import Move
+from src.outcome import WIN, DRAW, LOSS, OUTCOME_NAMES, add_outcome, resolve
+from src.utils import get_local_ip
+
+# Result message sent to the clients for each outcome from Player 1's point of view, and back
+RESULT_MESSAGES = {WIN: "Player 1 Wins", LOSS: "Player 2 Wins", DRAW: "Draw"}
+RESULT_OUTCOMES = {message: outcome for outcome, message in RESULT_MESSAGES.items()}
 
 class GameState:
     def __init__(self):
@@ -120,7 +134,16 @@ class GameServer:
                 self.broadcast(self.game_state.to_dict())
 
         elif msg_type == "choice":
-            self.game_state.choices[player_id] = data["choice"]
+            if not self.game_state.round_in_progress:
+                return
+
+            # Reject anything but the three moves here, so the winner logic only ever sees valid moves
+            try:
+                move = Move.parse(data.get("choice"))
+            except ValueError as e:
+                self.send_error(player_id, str(e))
+                return
+            self.game_state.choices[player_id] = move.key
             
             if len(self.game_state.choices) == 2:
                 # Determine winner and update scores
@@ -147,26 +170,22 @@ class GameServer:
                 
                 self.broadcast(self.game_state.to_dict())
 
+    def send_error(self, player_id, message):
+        """Send an error message to a single client"""
+        client = self.game_state.clients.get(player_id)
+        if client is None:
+            return
+        try:
+            client.send((json.dumps({"type": "error", "message": message}) + '\n').encode())
+        except:
+            pass
+
     def determine_winner(self, p1_choice, p2_choice):
-        if p1_choice == p2_choice:
-            return "Draw"
-        elif (p1_choice == "rock" and p2_choice == "scissors") or \
-             (p1_choice == "paper" and p2_choice == "rock") or \
-             (p1_choice == "scissors" and p2_choice == "paper"):
-            return "Player 1 Wins"
-        else:
-            return "Player 2 Wins"
+        return RESULT_MESSAGES[resolve(Move.parse(p1_choice), Move.parse(p2_choice))]
 
     def update_scores(self, result):
-        if result == "Draw":
-            self.game_state.scores[1]["draws"] += 1
-            self.game_state.scores[2]["draws"] += 1
-        elif result == "Player 1 Wins":
-            self.game_state.scores[1]["wins"] += 1
-            self.game_state.scores[2]["losses"] += 1
-        else:
-            self.game_state.scores[1]["losses"] += 1
-            self.game_state.scores[2]["wins"] += 1
+        outcome = OUTCOME_NAMES[RESULT_OUTCOMES[result]]
+        add_outcome(self.game_state.scores[1], self.game_state.scores[2], outcome)
 
     def run(self):
         """Main server loop"""
@@ -0,0 +1,89 @@
+import sys
+import time
+import builtins
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Command line flag every entry point accepts. Kept outside src.engine so importing it does not import the engine
+PROFILE_FLAG = "--profile-startup"
+
+
+# Records how long module imports and the startup steps take until the game is interactive
+class StartupProfiler:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks: List[Tuple[str, float]] = []
+        # (top level package, thread name) -> seconds spent importing it, excluding nested imports of other packages
+        self.imports: Dict[Tuple[str, str], float] = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self._original_import = None
+
+    def install(self) -> "StartupProfiler":
+        """Start timing every first import of a module"""
+        if self._original_import is None:
+            self._original_import = builtins.__import__
+            builtins.__import__ = self._import
+        return self
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _loads_something(self, name: str, fromlist, level: int) -> bool:
+        if level or not name:
+            return False
+        if name not in sys.modules:
+            return True
+        # "from package import submodule" loads the submodule without a separate import call
+        return any(isinstance(item, str) and item != "*" and f"{name}.{item}" not in sys.modules for item in fromlist or ())
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        if not self._loads_something(name, fromlist, level):
+            return original(name, globals, locals, fromlist, level)
+
+        stack = getattr(self.local, "stack", None)
+        if stack is None:
+            stack = self.local.stack = []
+        stack.append(0.0)  # time spent in nested imports
+        start = time.perf_counter()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            key = (name.split(".")[0], threading.current_thread().name)
+            with self.lock:
+                self.imports[key] = self.imports.get(key, 0.0) + elapsed - nested
+
+    def mark(self, label: str):
+        """Record that a startup step finished"""
+        with self.lock:
+            self.marks.append((label, time.perf_counter() - self.start))
+
+    def report(self, top: int = 15) -> str:
+        """Startup steps in order and the slowest imports by package"""
+        with self.lock:
+            marks = list(self.marks)
+            imports = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)
+
+        lines = ["Startup profile", "", f"{'step':<36} {'ms since launch':>16}"]
+        lines += [f"{label:<36} {seconds * 1000:16.1f}" for label, seconds in marks]
+        lines += ["", f"{'package':<24} {'thread':<20} {'import ms':>10}"]
+        lines += [f"{package:<24} {thread:<20} {seconds * 1000:10.1f}" for (package, thread), seconds in imports[:top]]
+        total = sum(seconds for _, seconds in imports)
+        lines.append(f"{'all imports':<45} {total * 1000:10.1f}")
+        return "\n".join(lines)
+
+
+def profiler_from_argv(argv: Optional[List[str]] = None) -> Optional[StartupProfiler]:
+    """
+    Start profiling if the entry point was run with --profile-startup.
+    Call it before any other import of the entry point so those are measured too.
+    """
+    argv = sys.argv if argv is None else argv
+    return StartupProfiler().install() if PROFILE_FLAG in argv else None
@@ -1,14 +1,16 @@
-import cv2
 import json
 import os
 import socket
 import logging
-import mediapipe as mp
-import numpy as np
 from typing import List, Dict, Optional, Tuple
-from azure.ai.inference import ChatCompletionsClient
-from azure.ai.inference.models import SystemMessage
-from azure.core.credentials import AzureKeyCredential
+
+
+# The Azure SDK is only needed by the AI modes, import it on first use so the other modes start faster
+def load_inference_sdk():
+    from azure.ai.inference import ChatCompletionsClient
+    from azure.ai.inference.models import SystemMessage
+    from azure.core.credentials import AzureKeyCredential
+    return ChatCompletionsClient, SystemMessage, AzureKeyCredential
 
 
 # Function to load env cause dotenv is not working in the windows environment and i can't switch because i dont have camera access in the wsl ubuntu environment
@@ -112,7 +114,9 @@ def run_rock_paper_scissors_openai_model(
                 }
             }
         ],
-        tool_choice: dict = {"type": "function", "function": {"name": "play_rock_paper_scissors"}}
+        tool_choice: dict = {"type": "function", "function": {"name": "play_rock_paper_scissors"}},
+        timeout: Optional[float] = None,
+        log: bool = True
     ) -> Dict:
     """
     Run a Rock-Paper-Scissors model with the given parameters.
@@ -121,17 +125,16 @@ def run_rock_paper_scissors_openai_model(
     :param model_name: The name of the model to use.
     :param api_key: The API key for authentication.
     :param tools: The tools required for the model.
+    :param timeout: Seconds to wait for the response, the client default when None.
+    :param log: Append the decision to the decision log, callers that may drop the answer log it themselves.
     :return: The response from the model.
     """
 
-    # Initialize the client
-    client = ChatCompletionsClient(
-        endpoint="https://models.inference.ai.azure.com",
-        credential=AzureKeyCredential(api_key),
-    )
-
-    # Make the request
-    response = client.complete(
+    # Make the request through the shared client, its connections stay open between moves
+    from src.inference_client import get_client_manager
+    _, SystemMessage, _ = load_inference_sdk()
+    response = get_client_manager().complete(
+        api_key,
         messages=[
             SystemMessage(content=prompt)
         ],
@@ -140,7 +143,8 @@ def run_rock_paper_scissors_openai_model(
         max_tokens=4096,
         top_p=1,
         tools=tools,
-        tool_choice=tool_choice
+        tool_choice=tool_choice,
+        **({"read_timeout": timeout} if timeout is not None else {})
     )
 
 
@@ -150,20 +154,10 @@ def run_rock_paper_scissors_openai_model(
         function_arguments = tool_calls[0]["function"]["arguments"]
         function_arguments_json = json.loads(function_arguments)
 
-        # Log the response to logs/log.json
-        log_file_path = "logs/log.json"
-        os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
-
-        if os.path.exists(log_file_path):
-            with open(log_file_path, "r") as log_file:
-                logs = json.load(log_file)
-        else:
-            logs = []
-
-        logs.append(function_arguments_json)
-
-        with open(log_file_path, "w") as log_file:
-            json.dump(logs, log_file, indent=4)
+        # Append the decision to logs/decisions.jsonl, thread safe and independent of the log size
+        if log:
+            from src.decision_log import get_decision_log
+            get_decision_log().append(function_arguments_json)
 
         return function_arguments_json
     except (KeyError, IndexError, json.JSONDecodeError):
@@ -211,7 +205,9 @@ def run_rock_paper_scissors_ai_vs_ai_openai_model(
                 }
             }
         ],
-        tool_choice: dict = {"type": "function", "function": {"name": "play_rock_paper_scissors"}}
+        tool_choice: dict = {"type": "function", "function": {"name": "play_rock_paper_scissors"}},
+        timeout: Optional[float] = None,
+        log: bool = True
     ) -> Dict:
     """
     Run a Rock-Paper-Scissors model with the given parameters.
@@ -220,17 +216,16 @@ def run_rock_paper_scissors_ai_vs_ai_openai_model(
     :param model_name: The name of the model to use.
     :param api_key: The API key for authentication.
     :param tools: The tools required for the model.
+    :param timeout: Seconds to wait for the response, the client default when None.
+    :param log: Append the decision to the decision log, callers that may drop the answer log it themselves.
     :return: The response from the model.
     """
 
-    # Initialize the client
-    client = ChatCompletionsClient(
-        endpoint="https://models.inference.ai.azure.com",
-        credential=AzureKeyCredential(api_key),
-    )
-
-    # Make the request
-    response = client.complete(
+    # Make the request through the shared client, its connections stay open between moves
+    from src.inference_client import get_client_manager
+    _, SystemMessage, _ = load_inference_sdk()
+    response = get_client_manager().complete(
+        api_key,
         messages=[
             SystemMessage(content=prompt)
         ],
@@ -239,7 +234,8 @@ def run_rock_paper_scissors_ai_vs_ai_openai_model(
         max_tokens=4096,
         top_p=1,
         tools=tools,
-        tool_choice=tool_choice
+        tool_choice=tool_choice,
+        **({"read_timeout": timeout} if timeout is not None else {})
     )
 
 
@@ -250,20 +246,10 @@ def run_rock_paper_scissors_ai_vs_ai_openai_model(
         function_arguments_json = json.loads(function_arguments)
         function_arguments_json["Name"] = name
 
-        # Log the response to logs/log.json
-        log_file_path = "logs/log.json"
-        os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
-
-        if os.path.exists(log_file_path):
-            with open(log_file_path, "r") as log_file:
-                logs = json.load(log_file)
-        else:
-            logs = []
-
-        logs.append(function_arguments_json)
-
-        with open(log_file_path, "w") as log_file:
-            json.dump(logs, log_file, indent=4)
+        # Append the decision to logs/decisions.jsonl, thread safe and independent of the log size
+        if log:
+            from src.decision_log import get_decision_log
+            get_decision_log().append(function_arguments_json)
 
         return function_arguments_json
     except (KeyError, IndexError, json.JSONDecodeError):